@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Callable
 
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from database import SessionLocal
@@ -99,40 +100,69 @@ _INITIAL_AUTHORITIES = [
 ]
 
 
-def _seed_tools(db: Session) -> None:
-    for tool_data in _INITIAL_TOOLS:
-        existing = db.query(Tool).filter(Tool.name == tool_data["name"]).first()
-        if existing:
+def _seed_missing(db: Session, model, key: str, rows: list[dict], label: str) -> None:
+    """Add the seed ``rows`` whose ``key`` column value is not stored yet.
+
+    Existing keys are fetched with one ``IN`` query per table rather than one
+    lookup per seed row.
+    """
+    key_column = getattr(model, key)
+    wanted = [row[key] for row in rows]
+    existing = {value for (value,) in db.query(key_column).filter(key_column.in_(wanted))}
+    for row in rows:
+        if row[key] in existing:
             continue
-        db_tool = Tool(**tool_data)
-        db.add(db_tool)
-        print(f"  - Created tool: {db_tool.name}")
+        db.add(model(**row))
+        print(f"  - Created {label}: {row[key]}")
+
+
+def _seed_tools(db: Session) -> None:
+    _seed_missing(db, Tool, "name", _INITIAL_TOOLS, "tool")
 
 
 def _seed_licenses(db: Session) -> None:
-    for license_data in _INITIAL_LICENSES:
-        existing = db.query(License).filter(License.short_name == license_data["short_name"]).first()
-        if existing:
-            continue
-        db_license = License(**license_data)
-        db.add(db_license)
-        print(f"  - Created license: {db_license.short_name}")
+    _seed_missing(db, License, "short_name", _INITIAL_LICENSES, "license")
 
 
 def _seed_authorities(db: Session) -> None:
-    for authority_data in _INITIAL_AUTHORITIES:
-        existing = db.query(TagAuthority).filter(TagAuthority.name == authority_data["name"]).first()
-        if existing:
-            continue
-        db_authority = TagAuthority(**authority_data)
-        db.add(db_authority)
-        print(f"  - Created tag authority: {db_authority.name}")
+    _seed_missing(db, TagAuthority, "name", _INITIAL_AUTHORITIES, "tag authority")
+
+
+_SEED_TABLES = (
+    (Tool, "name", _INITIAL_TOOLS),
+    (License, "short_name", _INITIAL_LICENSES),
+    (TagAuthority, "name", _INITIAL_AUTHORITIES),
+)
+
+
+def _all_seed_rows_present(db: Session) -> bool:
+    """Check every seed table in a single round trip.
+
+    Counts the distinct seed keys already stored per table; on an up-to-date
+    database this lets startup skip the per-table lookups and the commit.
+    """
+    counts = db.execute(
+        select(
+            *(
+                select(func.count(func.distinct(getattr(model, key))))
+                .where(getattr(model, key).in_([row[key] for row in rows]))
+                .scalar_subquery()
+                for model, key, rows in _SEED_TABLES
+            )
+        )
+    ).one()
+    return all(
+        count == len({row[key] for row in rows})
+        for count, (_, key, rows) in zip(counts, _SEED_TABLES)
+    )
 
 
 def populate_initial_data(session_factory: Callable[[], Session] = SessionLocal) -> None:
     """Idempotent seed data bootstrap used at startup."""
     db = session_factory()
     try:
+        if _all_seed_rows_present(db):
+            return
         _seed_tools(db)
         _seed_licenses(db)
         _seed_authorities(db)
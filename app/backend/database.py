@@ -1,6 +1,9 @@
 # ── Memory ───────────────────────────────────────────────────────────────────
 # 📄 docs: app/docs/memories/backend-startup.md
 # ──────────────────────────────────────────────────────────────────────────────
+import json
+import math
+
 from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
@@ -9,10 +12,62 @@ from atelierai.config import DATABASE_URL
 
 is_sqlite = "sqlite" in DATABASE_URL
 
+try:
+    import orjson as _orjson  # pyright: ignore[reportMissingImports]
+except ImportError:
+    _orjson = None
+
+
+def _has_non_finite_float(value) -> bool:
+    """True if ``value`` contains a NaN or infinite float at any depth."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite_float(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite_float(item) for item in value)
+    return False
+
+
+def _json_serializer(value) -> str:
+    """Serialize JSON columns (exif_data, json_metadata, ...) via orjson when installed.
+
+    Falls back to ``json.dumps`` for values orjson rejects (e.g. ints beyond
+    64 bits) and for NaN/Infinity, which orjson would silently write as
+    ``null``, so stored values are the same as before.
+    """
+    if _orjson is not None:
+        try:
+            encoded = _orjson.dumps(value, option=_orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+        else:
+            # Non-finite floats can only hide behind a null; skip the walk
+            # for the common output that has none.
+            if b"null" not in encoded or not _has_non_finite_float(value):
+                return encoded.decode()
+    return json.dumps(value)
+
+
+def _json_deserializer(text: str):
+    """Parse JSON columns via orjson, falling back for legacy NaN/Infinity values."""
+    if _orjson is not None:
+        try:
+            return _orjson.loads(text)
+        except ValueError:
+            pass
+    return json.loads(text)
+
+
 # Create the SQLAlchemy engine
 # For SQLite: allow cross-thread access, increase busy timeout, and prefer WAL mode.
 sqlite_connect_args = {"check_same_thread": False, "timeout": 30} if is_sqlite else {}
-engine = create_engine(DATABASE_URL, connect_args=sqlite_connect_args)
+engine = create_engine(
+    DATABASE_URL,
+    connect_args=sqlite_connect_args,
+    json_serializer=_json_serializer,
+    json_deserializer=_json_deserializer,
+)
 
 
 if is_sqlite:
@@ -22,6 +77,12 @@ if is_sqlite:
         cursor.execute("PRAGMA journal_mode=WAL")
         cursor.execute("PRAGMA synchronous=NORMAL")
         cursor.execute("PRAGMA busy_timeout=30000")
+        # Keep sort/temp B-trees off disk and give each connection a 64 MiB
+        # page cache (negative = KiB) for scan/upload bursts.
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-64000")
+        # Read pages through a 256 MiB memory map instead of read() syscalls.
+        cursor.execute("PRAGMA mmap_size=268435456")
         cursor.close()
 
 # Create a configured "Session" class
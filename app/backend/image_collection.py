@@ -1,11 +1,13 @@
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Optional
 from datetime import date, datetime
 
 from PIL import Image
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, select
 from models import (
     AuthorityTerm,
     Concept,
@@ -47,6 +49,12 @@ except Exception:
 class ImageCollection:
     """A class to manage and process a collection of images in the library."""
 
+    # Worker threads / files per batch used to prepare files during scan().
+    SCAN_MAX_WORKERS = min(8, os.cpu_count() or 1)
+    SCAN_BATCH_SIZE = 64
+    # Hashes per IN (...) lookup; well under SQLite's bound-parameter limit.
+    HASH_LOOKUP_CHUNK = 500
+
     def __init__(self, db: Session):
         self.db = db
         self.library_path = Path(IMAGE_LIBRARY_PATH)
@@ -86,6 +94,17 @@ class ImageCollection:
             "errors": 0,
         }
         self.error_messages: List[str] = []
+        # Artist ids resolved by name; uploads pass the same artist_name for
+        # every file in a batch.
+        self._artist_ids_by_name: Dict[str, int] = {}
+
+    def _resolve_artist_id(self, artist_name: str) -> int:
+        """Returns the id of the named artist, creating it on first use."""
+        artist_id = self._artist_ids_by_name.get(artist_name)
+        if artist_id is None:
+            artist_id = ImageProcessor.find_or_create_artist(self.db, artist_name).id
+            self._artist_ids_by_name[artist_name] = artist_id
+        return artist_id
 
     @staticmethod
     def _normalize_text(value: Any) -> str:
@@ -1413,17 +1432,19 @@ class ImageCollection:
             return
 
         try:
-            # Find other active images with the same file_hash
-            sibling = (
-                self.db.query(ImageModel)
+            # Find other active images with the same file_hash. Only the id is
+            # used, so skip loading and hydrating the whole row.
+            sibling_id = (
+                self.db.query(ImageModel.id)
                 .filter(
                     ImageModel.file_hash == new_image.file_hash,
                     ImageModel.id != new_image.id,
                     ImageModel.image_status != "tombstoned",
                 )
-                .first()
+                .limit(1)
+                .scalar()
             )
-            if sibling is None:
+            if sibling_id is None:
                 return  # No duplicate, nothing to group
 
             group_key = f"hash:{new_image.file_hash}"
@@ -1448,7 +1469,7 @@ class ImageCollection:
 
                 # Add the sibling (previously existing image) as first member
                 sibling_membership = ImageVariantGroupMembership(
-                    image_id=sibling.id,
+                    image_id=sibling_id,
                     group_id=existing_group.id,
                     role_in_group="member",
                     sort_index=0,
@@ -1507,16 +1528,17 @@ class ImageCollection:
 
         try:
             # Find other active images with the same civitai_image_id
-            sibling = (
-                self.db.query(ImageModel)
+            sibling_id = (
+                self.db.query(ImageModel.id)
                 .filter(
                     ImageModel.civitai_image_id == civitai_image_id,
                     ImageModel.id != db_record.id,
                     ImageModel.image_status != "tombstoned",
                 )
-                .first()
+                .limit(1)
+                .scalar()
             )
-            if sibling is None:
+            if sibling_id is None:
                 return  # No duplicate, nothing to group
 
             group_key = f"civitai:{civitai_image_id}"
@@ -1541,7 +1563,7 @@ class ImageCollection:
 
                 # Add the sibling (previously existing image) as first member
                 sibling_membership = ImageVariantGroupMembership(
-                    image_id=sibling.id,
+                    image_id=sibling_id,
                     group_id=existing_group.id,
                     role_in_group="member",
                     sort_index=0,
@@ -1627,17 +1649,14 @@ class ImageCollection:
             if fn_suffix and fn_suffix != file_extension:
                 original_filename = Path(original_filename).stem + file_extension
 
-        artist_obj = None
-        if artist_name:
-            artist_obj = ImageProcessor.find_or_create_artist(self.db, artist_name)
-
         new_image = processor.create_database_record(
             relative_filepath=relative_path,
             original_filename=original_filename,
-            artist_obj=artist_obj,
             source_url=source_url,
             license_id=license_id,
         )
+        if artist_name:
+            new_image.artist_id = self._resolve_artist_id(artist_name)
         self.db.add(new_image)
         self.db.flush()  # Flush to get the ID
 
@@ -1665,12 +1684,27 @@ class ImageCollection:
         artist_name: Optional[str] = None,
         source_url: Optional[str] = None,
         license_id: Optional[int] = None,
+        processor: Optional[ImageProcessor] = None,
+        existing_by_hash: Optional[Dict[str, Optional[ImageModel]]] = None,
     ) -> Dict[str, Any]:
-        """Ingest one uploaded file through the same import steps used by scan."""
-        processor = ImageProcessor(
-            str(uploaded_file_path), self.db, str(self.library_path)
-        )
-        existing_image = processor.find_in_database()
+        """Ingest one uploaded file through the same import steps used by scan.
+
+        Args:
+            processor: Optional ImageProcessor already built for
+                ``uploaded_file_path`` (e.g. hashed off the event loop).
+            existing_by_hash: Optional batch lookup of ``file_hash`` to the
+                matching ImageModel (or None when absent); hashes missing from
+                the mapping fall back to a per-file query.
+        """
+        if processor is None:
+            processor = ImageProcessor(
+                str(uploaded_file_path), self.db, str(self.library_path)
+            )
+        if existing_by_hash is not None and processor.file_hash in existing_by_hash:
+            existing_image = existing_by_hash[processor.file_hash]
+            processor.db_record = existing_image
+        else:
+            existing_image = processor.find_in_database()
 
         if existing_image is not None:
             existing_status = (
@@ -1698,10 +1732,7 @@ class ImageCollection:
                 if license_id is not None:
                     existing_image.license_id = license_id
                 if artist_name:
-                    artist_obj = ImageProcessor.find_or_create_artist(
-                        self.db, artist_name
-                    )
-                    existing_image.artist_id = artist_obj.id
+                    existing_image.artist_id = self._resolve_artist_id(artist_name)
 
                 self.db.flush()
                 self.db.commit()
@@ -1778,10 +1809,19 @@ class ImageCollection:
             return {"observations_created": 0}
 
         now = datetime.utcnow()
-        _seen: set[tuple[int, int, int]] = set()
+        image_id = int(db_record.id)
         observations_created = 0
+        new_rows: list[dict[str, Any]] = []
 
         try:
+            # Terms this image already has an observation for, loaded once
+            # instead of one existence query per term.
+            observed_term_ids = {
+                term_id
+                for (term_id,) in self.db.query(
+                    ImageConceptObservation.authority_term_id
+                ).filter(ImageConceptObservation.image_id == image_id)
+            }
             for source, tag_names in tags_by_source.items():
                 if not tag_names:
                     continue
@@ -1805,43 +1845,29 @@ class ImageCollection:
                 )
 
                 for term in terms:
-                    concept_id = term.concept_id  # May be None for orphans
-
                     # Dedup by authority_term_id — one observation per term
-                    obs_key = (int(db_record.id), int(term.id), authority_id)
-                    if obs_key in _seen:
-                        continue
-
-                    existing = (
-                        self.db.query(ImageConceptObservation.id)
-                        .filter(
-                            ImageConceptObservation.image_id == db_record.id,
-                            ImageConceptObservation.authority_term_id == term.id,
-                        )
-                        .first()
-                    )
-                    if existing is not None:
-                        _seen.add(obs_key)
+                    term_id = int(term.id)
+                    if term_id in observed_term_ids:
                         continue
-
-                    self.db.add(
-                        ImageConceptObservation(
-                            image_id=int(db_record.id),
-                            concept_id=concept_id,
-                            authority_id=authority_id,
-                            authority_term_id=int(term.id),
-                            source_type=ObservationSource.IMPORT,
-                            certainty_label=ObservationCertainty.LIKELY,
-                            is_present=True,
-                            is_curated=False,
-                            created_at=now,
-                            updated_at=now,
-                        )
+                    observed_term_ids.add(term_id)
+                    new_rows.append(
+                        {
+                            "image_id": image_id,
+                            "concept_id": term.concept_id,  # May be None for orphans
+                            "authority_id": authority_id,
+                            "authority_term_id": term_id,
+                            "source_type": ObservationSource.IMPORT,
+                            "certainty_label": ObservationCertainty.LIKELY,
+                            "is_present": True,
+                            "is_curated": False,
+                            "created_at": now,
+                            "updated_at": now,
+                        }
                     )
-                    _seen.add(obs_key)
-                    observations_created += 1
 
-            self.db.flush()
+            if new_rows:
+                self.db.bulk_insert_mappings(ImageConceptObservation, new_rows)
+            observations_created = len(new_rows)
             self.db.commit()
         except Exception as exc:
             self.db.rollback()
@@ -2211,17 +2237,30 @@ class ImageCollection:
     def _cleanup_orphaned_records(self):
         """Finds and removes database records for files that no longer exist on the filesystem."""
         print("Starting cleanup of orphaned database records...")
-        all_db_images = self.db.query(ImageModel.file_path, ImageModel.id).all()
         # Get all files on disk, excluding JSON metadata files (we only care about image files)
-        existing_files_on_disk = {
-            str(p)
-            for p in self.library_path.iterdir()
-            if p.is_file() and not p.name.endswith(".json")
-        }
+        files_on_disk = self._list_library_files(json_files=False)
+        existing_files_on_disk = {str(p) for p in files_on_disk}
+
+        # Rows whose file_path is exactly the name of a file on disk are not
+        # orphans, so they are filtered out in SQL. This does not make the scan
+        # cheaper, but it keeps those rows from being loaded and checked below.
+        # SQLite takes the names as one JSON parameter (json_each) rather than
+        # one bound parameter per file.
+        disk_names = [p.name for p in files_on_disk]
+        if self.db.get_bind().dialect.name == "sqlite":
+            on_disk = func.json_each(json.dumps(disk_names)).table_valued("value")
+            disk_name_filter = ImageModel.file_path.not_in(select(on_disk.c.value))
+        else:
+            disk_name_filter = ImageModel.file_path.not_in(disk_names)
+        candidate_db_images = (
+            self.db.query(ImageModel.file_path, ImageModel.id)
+            .filter(disk_name_filter)
+            .all()
+        )
 
         orphaned_ids = []
         orphaned_json_paths = []
-        for relative_path, image_id in all_db_images:
+        for relative_path, image_id in candidate_db_images:
             absolute_path_from_db = str(self.library_path / relative_path)
             if absolute_path_from_db not in existing_files_on_disk:
                 orphaned_ids.append(image_id)
@@ -2489,10 +2528,7 @@ class ImageCollection:
         json_data_by_hash: Dict[str, ImageData] = {}
         processed_json_files: set = set()
 
-        for json_file in self.library_path.iterdir():
-            if not json_file.is_file() or not json_file.name.endswith(".json"):
-                continue
-
+        for json_file in self._list_library_files(json_files=True):
             if str(json_file) in processed_json_files:
                 continue
 
@@ -2650,145 +2686,235 @@ class ImageCollection:
             json_data_by_hash: Dictionary mapping file hashes to their ImageData instances
         """
         print("Starting image file scan...")
-        for image_file in self.library_path.iterdir():
-            # Skip JSON files and non-files
-            if not image_file.is_file() or image_file.name.endswith(".json"):
-                continue
-
-            try:
-                processor = ImageProcessor(
-                    str(image_file), self.db, str(self.library_path)
+        image_files = self._list_library_files(json_files=False)
+
+        # Hashing, decoding and EXIF extraction run on worker threads one batch
+        # at a time; the DB work for each file below stays on this thread.
+        # The next batch is submitted before the current one's DB work starts,
+        # so the workers are not idle while this thread writes.
+        batches = [
+            image_files[start : start + self.SCAN_BATCH_SIZE]
+            for start in range(0, len(image_files), self.SCAN_BATCH_SIZE)
+        ]
+        with ThreadPoolExecutor(max_workers=self.SCAN_MAX_WORKERS) as executor:
+            pending = (
+                executor.map(self._build_scan_processor, batches[0]) if batches else None
+            )
+            for index, batch in enumerate(batches):
+                processors = list(pending)
+                existing_by_hash = self.find_existing_by_hash(
+                    p.file_hash for p in processors if isinstance(p, ImageProcessor)
                 )
-                self.results["images_scanned"] += 1
-                file_hash = processor.file_hash
-                file_extension = (
-                    (
-                        processor.mime_to_extension(processor.mimetype)
-                        if processor.mimetype
-                        else None
+                # Files whose hash is not stored yet become new records, which
+                # keep a blurhash; decode those on the workers too (once per
+                # hash) ahead of the next batch, rather than here on demand.
+                blurhash_jobs = {}
+                for p in processors:
+                    if (
+                        isinstance(p, ImageProcessor)
+                        and existing_by_hash.get(p.file_hash) is None
+                        and p.file_hash not in blurhash_jobs
+                    ):
+                        blurhash_jobs[p.file_hash] = executor.submit(p.compute_blurhash)
+                if index + 1 < len(batches):
+                    pending = executor.map(
+                        self._build_scan_processor, batches[index + 1]
                     )
-                    or processor.original_path.suffix.lower()
-                    or processor.extension
-                    or ".jpg"
-                )
-                expected_filename = f"{file_hash}{file_extension}"
-                db_record = processor.find_in_database()
-
-                # Use JSON metadata as source of authority if available
-                json_data = json_data_by_hash.get(file_hash) if file_hash else None
+                for image_file, processor in zip(batch, processors):
+                    try:
+                        if isinstance(processor, Exception):
+                            raise processor
+                        blurhash_job = blurhash_jobs.get(processor.file_hash)
+                        if blurhash_job is not None:
+                            blurhash_job.result()
+                        self.results["images_scanned"] += 1
+                        file_hash = processor.file_hash
+                        file_extension = (
+                            (
+                                processor.mime_to_extension(processor.mimetype)
+                                if processor.mimetype
+                                else None
+                            )
+                            or processor.original_path.suffix.lower()
+                            or processor.extension
+                            or ".jpg"
+                        )
+                        expected_filename = f"{file_hash}{file_extension}"
+                        if file_hash in existing_by_hash:
+                            # Consumed once: a later copy of the same file in
+                            # this batch must see a row imported meanwhile.
+                            db_record = existing_by_hash.pop(file_hash)
+                            processor.db_record = db_record
+                        else:
+                            db_record = processor.find_in_database()
+
+                        # Use JSON metadata as source of authority if available
+                        json_data = json_data_by_hash.get(file_hash) if file_hash else None
+
+                        # If no JSON data, try to load from file
+                        if not json_data:
+                            json_data = ImageData.from_json_file(
+                                image_file.with_suffix(".json")
+                            )
 
-                # If no JSON data, try to load from file
-                if not json_data:
-                    json_data = ImageData.from_json_file(
-                        image_file.with_suffix(".json")
-                    )
+                        # Get original filename from JSON or use current filename
+                        original_filename = (
+                            json_data.file_name
+                            if json_data and json_data.file_name
+                            else (processor.metadata.file_name or image_file.name)
+                        )
 
-                # Get original filename from JSON or use current filename
-                original_filename = (
-                    json_data.file_name
-                    if json_data and json_data.file_name
-                    else (processor.metadata.file_name or image_file.name)
-                )
+                        # Determine the actual file path to use (after potential renaming)
+                        final_file_path = image_file
+
+                        if db_record is not None:
+                            # File is a known entity (already exists in database)
+                            # Update record with actual file data (file is authority for these fields)
+
+                            # Check if file needs renaming to standardized name
+                            if image_file.name != expected_filename:
+                                print(
+                                    f"Renaming file '{image_file.name}' to standardized name '{expected_filename}'"
+                                )
+                                processor.save_to_library()
+                                self.results["files_renamed"] += 1
+                                final_file_path = (
+                                    processor.original_path
+                                )  # Updated path after rename
+
+                                # Update database record with actual file data
+                                self.db.query(ImageModel).filter(
+                                    ImageModel.id == db_record.id
+                                ).update(
+                                    {
+                                        ImageModel.file_path: expected_filename,
+                                        ImageModel.file_size: processor.file_size,
+                                        ImageModel.width: processor.width,
+                                        ImageModel.height: processor.height,
+                                        ImageModel.mimetype: processor.mimetype,
+                                        ImageModel.date_modified: processor.date_modified,
+                                    },
+                                    synchronize_session=False,
+                                )
+
+                                # Save updated JSON with new file path and actual file data
+                                processor.save_json_metadata(processor.original_path, db_record)
+                                self.db.commit()
+                            else:
+                                # File has correct name, just update with actual file data if needed
+                                # JSON is source of authority for metadata, but file overrides for file-derived fields
+                                # Reuse the fstat taken when the processor
+                                # opened the file rather than stat'ing again.
+                                actual_file_stat = (
+                                    processor.stat_result or image_file.stat()
+                                )
+                                current_file_size = (
+                                    db_record.file_size
+                                    if db_record.file_size is not None
+                                    else 0
+                                )
+                                current_width = (
+                                    db_record.width if db_record.width is not None else 0
+                                )
+                                current_height = (
+                                    db_record.height if db_record.height is not None else 0
+                                )
+                                needs_update = bool(
+                                    current_file_size != actual_file_stat.st_size
+                                    or current_width != processor.width
+                                    or current_height != processor.height
+                                )
+                                if needs_update:
+                                    self.db.query(ImageModel).filter(
+                                        ImageModel.id == db_record.id
+                                    ).update(
+                                        {
+                                            ImageModel.file_size: processor.file_size,
+                                            ImageModel.width: processor.width,
+                                            ImageModel.height: processor.height,
+                                            ImageModel.date_modified: processor.date_modified,
+                                        },
+                                        synchronize_session=False,
+                                    )
+                                    # Update JSON with current file data
+                                    processor.save_json_metadata(image_file, db_record)
+                                    self.db.commit()
+
+                                # Check if JSON file exists, create if missing
+                                self._ensure_json_file_exists(
+                                    final_file_path, db_record, processor
+                                )
+
+                            self._hydrate_missing_metadata_fields(
+                                db_record=db_record,
+                                image_path=final_file_path,
+                                processor=processor,
+                            )
+                        else:
+                            # This shouldn't happen if JSON was processed, but handle it
+                            # File is new and needs to be imported
+                            print(
+                                f"New image file detected (no JSON record): {image_file.name}"
+                            )
 
-                # Determine the actual file path to use (after potential renaming)
-                final_file_path = image_file
+                            self._import_new_image_with_processor(
+                                processor=processor,
+                                image_file=image_file,
+                                original_filename=original_filename,
+                            )
 
-                if db_record is not None:
-                    # File is a known entity (already exists in database)
-                    # Update record with actual file data (file is authority for these fields)
+                    except Exception as e:
+                        self.db.rollback()
+                        self.error_messages.append(f"Could not process {image_file.name}: {e}")
+                        self.results["errors"] += 1
 
-                    # Check if file needs renaming to standardized name
-                    if image_file.name != expected_filename:
-                        print(
-                            f"Renaming file '{image_file.name}' to standardized name '{expected_filename}'"
-                        )
-                        processor.save_to_library()
-                        self.results["files_renamed"] += 1
-                        final_file_path = (
-                            processor.original_path
-                        )  # Updated path after rename
-
-                        # Update database record with actual file data
-                        self.db.query(ImageModel).filter(
-                            ImageModel.id == db_record.id
-                        ).update(
-                            {
-                                ImageModel.file_path: expected_filename,
-                                ImageModel.file_size: processor.file_size,
-                                ImageModel.width: processor.width,
-                                ImageModel.height: processor.height,
-                                ImageModel.mimetype: processor.mimetype,
-                                ImageModel.date_modified: processor.date_modified,
-                            },
-                            synchronize_session=False,
-                        )
+    def find_existing_by_hash(
+        self, file_hashes: Iterable[str]
+    ) -> Dict[str, Optional[ImageModel]]:
+        """Maps each hash to its stored ImageModel, or None when absent.
 
-                        # Save updated JSON with new file path and actual file data
-                        processor.save_json_metadata(processor.original_path, db_record)
-                        self.db.commit()
-                    else:
-                        # File has correct name, just update with actual file data if needed
-                        # JSON is source of authority for metadata, but file overrides for file-derived fields
-                        actual_file_stat = image_file.stat()
-                        current_file_size = (
-                            db_record.file_size
-                            if db_record.file_size is not None
-                            else 0
-                        )
-                        current_width = (
-                            db_record.width if db_record.width is not None else 0
-                        )
-                        current_height = (
-                            db_record.height if db_record.height is not None else 0
-                        )
-                        needs_update = bool(
-                            current_file_size != actual_file_stat.st_size
-                            or current_width != processor.width
-                            or current_height != processor.height
-                        )
-                        if needs_update:
-                            self.db.query(ImageModel).filter(
-                                ImageModel.id == db_record.id
-                            ).update(
-                                {
-                                    ImageModel.file_size: processor.file_size,
-                                    ImageModel.width: processor.width,
-                                    ImageModel.height: processor.height,
-                                    ImageModel.date_modified: processor.date_modified,
-                                },
-                                synchronize_session=False,
-                            )
-                            # Update JSON with current file data
-                            processor.save_json_metadata(image_file, db_record)
-                            self.db.commit()
+        Equivalent to ``ImageProcessor.find_in_database`` for every hash
+        (several rows may share a hash; the lowest id wins) but issued as
+        ``IN`` queries of ``HASH_LOOKUP_CHUNK`` hashes instead of one per file.
+        """
+        hashes = list(dict.fromkeys(h for h in file_hashes if h))
+        existing: Dict[str, Optional[ImageModel]] = dict.fromkeys(hashes)
+        for start in range(0, len(hashes), self.HASH_LOOKUP_CHUNK):
+            chunk = hashes[start : start + self.HASH_LOOKUP_CHUNK]
+            rows = (
+                self.db.query(ImageModel)
+                .filter(ImageModel.file_hash.in_(chunk))
+                .order_by(ImageModel.id)
+            )
+            for image in rows:
+                if existing[image.file_hash] is None:
+                    existing[image.file_hash] = image
+        return existing
 
-                        # Check if JSON file exists, create if missing
-                        self._ensure_json_file_exists(
-                            final_file_path, db_record, processor
-                        )
+    def _list_library_files(self, json_files: bool) -> List[Path]:
+        """Lists the regular files at the top of the library directory.
 
-                    self._hydrate_missing_metadata_fields(
-                        db_record=db_record,
-                        image_path=final_file_path,
-                        processor=processor,
-                    )
-                else:
-                    # This shouldn't happen if JSON was processed, but handle it
-                    # File is new and needs to be imported
-                    print(
-                        f"New image file detected (no JSON record): {image_file.name}"
-                    )
+        Returns the ``.json`` sidecars when ``json_files`` is true, otherwise
+        everything else. Uses ``os.scandir`` so the file check comes from the
+        directory entry type instead of a ``stat`` call per path.
+        """
+        with os.scandir(self.library_path) as entries:
+            return [
+                Path(entry.path)
+                for entry in entries
+                if entry.name.endswith(".json") == json_files and entry.is_file()
+            ]
 
-                    self._import_new_image_with_processor(
-                        processor=processor,
-                        image_file=image_file,
-                        original_filename=original_filename,
-                    )
+    def _build_scan_processor(self, image_file: Path) -> ImageProcessor | Exception:
+        """Builds the ImageProcessor for one library file (worker-thread safe).
 
-            except Exception as e:
-                self.db.rollback()
-                self.error_messages.append(f"Could not process {image_file.name}: {e}")
-                self.results["errors"] += 1
+        Errors are returned rather than raised so the caller can record them
+        against the file in order.
+        """
+        try:
+            return ImageProcessor(str(image_file), self.db, str(self.library_path))
+        except Exception as e:
+            return e
 
     def scan(self) -> Dict[str, Any]:
         """
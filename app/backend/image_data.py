@@ -182,12 +182,14 @@ class ImageData:
             return cls.from_json(f.read())
 
     @classmethod
-    def from_db_record(cls, db_record) -> "ImageData":
+    def from_db_record(cls, db_record, include_exif: bool = True) -> "ImageData":
         """
         Create an ImageData instance from a database record.
 
         Args:
             db_record: ImageModel database record.
+            include_exif: When False, ``exif_data`` is left unset so a record
+                loaded with the column deferred does not lazy-load it.
 
         Returns:
             A new ImageData instance populated with the database record data.
@@ -215,7 +217,7 @@ class ImageData:
             source_url=db_record.source_url,
             source_site=getattr(db_record, "source_site", None),
             license_id=db_record.license_id,
-            exif_data=db_record.exif_data,
+            exif_data=db_record.exif_data if include_exif else None,
             json_metadata=db_record.json_metadata or {},
             civitai_data=((db_record.json_metadata or {}).get("civitai", {})),
             civitai_uuid=getattr(db_record, "civitai_uuid", None),
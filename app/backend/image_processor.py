@@ -1,7 +1,10 @@
 import os
+import errno
 import hashlib
 import json
+import logging
 import mimetypes
+import mmap
 import re
 import shutil
 import subprocess
@@ -10,7 +13,7 @@ from pathlib import Path
 from typing import Optional, Any
 from urllib.parse import urlsplit
 
-from PIL import Image
+from PIL import Image, UnidentifiedImageError
 from PIL.ExifTags import TAGS
 from sqlalchemy.orm import Session
 
@@ -26,8 +29,12 @@ from models import ImageModel, Artist
 from image_data import ImageData
 from utils.url_helpers import normalize_civitai_url
 
+logger = logging.getLogger(__name__)
+
 # A set of supported media extensions for easy lookup.
 ALLOWED_EXTENSIONS = {".png", ".jpg", ".jpeg", ".webp", ".jfif", ".mp4", ".webm"}
+# Same extensions as a tuple for str.endswith() checks on raw filenames.
+ALLOWED_SUFFIX_TUPLE = tuple(sorted(ALLOWED_EXTENSIONS))
 MIME_MAPPING = {
     ".png": "image/png",
     ".jpg": "image/jpeg",
@@ -38,6 +45,24 @@ MIME_MAPPING = {
     ".webm": "video/webm",
 }
 
+# PIL plugin to try first for each image extension, so Image.open skips
+# probing every registered format (and loading all plugins for WebP).
+_PIL_FORMAT_HINTS = {
+    ".png": ("PNG",),
+    ".jpg": ("JPEG",),
+    ".jpeg": ("JPEG",),
+    ".jfif": ("JPEG",),
+    ".webp": ("WEBP",),
+}
+
+# Value types kept as-is when flattening EXIF tags.
+_EXIF_ALLOWED_TYPES = (str, int, float, list, tuple, dict)
+# Bound once so the per-tag EXIF loops skip the global + attribute lookup.
+_TAGS_GET = TAGS.get
+
+# Files at least this large are hashed through mmap rather than read().
+_MMAP_HASH_MIN_SIZE = 1 << 20
+
 UUID_RE = re.compile(
     r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[1-5][0-9a-fA-F]{3}-[89abAB][0-9a-fA-F]{3}-[0-9a-fA-F]{12}$"
 )
@@ -458,6 +483,22 @@ def ensure_image_thumbnail(image_path: Path, resources_root: str | Path) -> Opti
     return thumbnail_path if thumbnail_path.exists() else None
 
 
+def sha256_file(file_path: str | Path) -> str:
+    """Returns the hex SHA-256 digest of a file.
+
+    Files of ``_MMAP_HASH_MIN_SIZE`` or more are hashed from a read-only mmap
+    in a single update (no buffer copies through Python). Smaller files, where
+    the mapping setup costs more than it saves, go through
+    ``hashlib.file_digest``.
+    """
+    with open(file_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= _MMAP_HASH_MIN_SIZE:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return hashlib.sha256(mapped).hexdigest()
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
 def _warn_exiftool_missing_once() -> None:
     """Log a one-time warning when exiftool is missing."""
     global _EXIFTOOL_WARNED
@@ -473,21 +514,32 @@ def _warn_exiftool_missing_once() -> None:
 class ImageProcessor:
     """A class to handle all operations for a single image file."""
 
-    def __init__(self, file_path: str, db: Session, library_path: str):
+    def __init__(
+        self,
+        file_path: str,
+        db: Session,
+        library_path: str,
+        file_hash: Optional[str] = None,
+    ):
+        """``file_hash`` may carry a SHA-256 already computed by the caller
+        (e.g. while streaming an upload to disk) so the file is not hashed twice.
+        """
         self.db = db
         self.library_path = library_path
-        # self.original_path = Path(file_path)
-        # self.original_filename = self.original_path.name
+        self.original_path = Path(file_path)
 
         # --- Initialize state using ImageData ---
         self.metadata: ImageData = ImageData()
         self.db_record: Optional[ImageModel] = None
         self.exif_tags: dict[str, Any] = {}
+        self.stat_result: Optional[os.stat_result] = None
+        self._known_file_hash = file_hash
 
         # --- Perform initial processing ---
-        self.metadata.file_path = str(Path(file_path))
-        self.metadata.file_name = Path(file_path).name
-        if not Path(file_path).is_file() or not self._is_valid_media():
+        self.metadata.file_path = str(self.original_path)
+        self.metadata.file_name = self.original_path.name
+        # Suffix check first: it needs no I/O, unlike is_file().
+        if not self._is_valid_media() or not self.original_path.is_file():
             print(f"File is not a supported media type: {self.metadata.file_name}")
             raise ValueError(f"File is not a supported media type: {self.metadata.file_name}")
 
@@ -561,9 +613,9 @@ class ImageProcessor:
 
     def _is_valid_media(self) -> bool:
         """Checks if the file has a supported extension."""
-        if self.metadata.file_path is None:
+        if self.metadata.file_path is None or not self.metadata.file_name:
             return False
-        return self.extension in ALLOWED_EXTENSIONS
+        return self.metadata.file_name.lower().endswith(ALLOWED_SUFFIX_TUPLE)
 
     def _extract_metadata_with_exiftool(self) -> tuple[int, int, Optional[str], dict, dict[str, Any]]:
         """Extract metadata using exiftool, used as fallback and for non-image files."""
@@ -612,27 +664,53 @@ class ImageProcessor:
             return 0, 0, fallback_mimetype, {}, {}
 
     def _process_file(self):
-        """Calculates hash, gets metadata, and size."""
-        self.metadata.file_hash = self._calculate_hash()
-        (
-            self.metadata.width,
-            self.metadata.height,
-            self.metadata.mimetype,
-            self.metadata.exif_data,
-            self.exif_tags,
-        ) = self._get_metadata()
-        if self.metadata.file_path:
-            self.metadata.file_size = Path(self.metadata.file_path).stat().st_size
+        """Calculates hash, gets metadata, and size in a single open/read pass.
 
-    def _calculate_hash(self) -> str:
-        """Calculates the SHA256 hash of the image file."""
+        The file is opened and stat'ed once; the hash is computed straight from
+        a read-only mmap and PIL decodes from that same mapping, so the bytes
+        only travel through the page cache once.
+        """
         if self.metadata.file_path is None:
             raise ValueError("File path is None")
-        h = hashlib.sha256()
         with open(self.metadata.file_path, "rb") as f:
-            while chunk := f.read(8192):
-                h.update(chunk)
-        return h.hexdigest()
+            self.stat_result = os.fstat(f.fileno())
+            mapped = None
+            if self.stat_result.st_size > 0:
+                try:
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except (OSError, ValueError):
+                    mapped = None
+            try:
+                source = mapped if mapped is not None else f
+                self.metadata.file_hash = self._known_file_hash or self._calculate_hash(source)
+                source.seek(0)
+                (
+                    self.metadata.width,
+                    self.metadata.height,
+                    self.metadata.mimetype,
+                    self.metadata.exif_data,
+                    self.exif_tags,
+                ) = self._get_metadata(source)
+            finally:
+                if mapped is not None:
+                    mapped.close()
+        self.metadata.file_size = self.stat_result.st_size
+
+    def _calculate_hash(self, source: Any = None) -> str:
+        """Calculates the SHA256 hash of the image file.
+
+        ``source`` may be an mmap (hashed in one call) or an open binary file;
+        when omitted the file at ``metadata.file_path`` goes through
+        ``sha256_file``.
+        """
+        if isinstance(source, mmap.mmap):
+            return hashlib.sha256(source).hexdigest()
+        if source is not None:
+            source.seek(0)
+            return hashlib.file_digest(source, "sha256").hexdigest()
+        if self.metadata.file_path is None:
+            raise ValueError("File path is None")
+        return sha256_file(self.metadata.file_path)
 
     @staticmethod
     def mime_to_extension(mime_type: str | None) -> Optional[str]:
@@ -725,12 +803,23 @@ class ImageProcessor:
         # Fallback for Rational/IFDRational and other Pillow-specific types.
         return str(value)
 
-    def _extract_standard_exif_tags(self, exif_data_raw) -> dict:
-        """Extracts standard EXIF tags from raw EXIF data."""
+    def _extract_standard_exif_tags(
+        self,
+        exif_data_raw,
+        exif_tags: Optional[dict[str, Any]] = None,
+    ) -> dict:
+        """Extracts standard EXIF tags from raw EXIF data.
+
+        When ``exif_tags`` is given, the raw ``exif:<name>`` entries are filled
+        in the same pass instead of walking the tags a second time.
+        """
         exif_data = {}
+        to_json_safe = self._to_json_safe
         for tag, value in exif_data_raw.items():
-            tag_name = TAGS.get(tag, tag)
-            if isinstance(value, (str, int, float, list, tuple, dict)):
+            if exif_tags is not None:
+                exif_tags[f"exif:{_TAGS_GET(tag, f'tag_{tag}')}"] = to_json_safe(value)
+            tag_name = _TAGS_GET(tag, tag)
+            if isinstance(value, _EXIF_ALLOWED_TYPES):
                 exif_data[tag_name] = value
             elif isinstance(value, bytes):
                 decoded_value = self.decode_exif_value(value)
@@ -756,11 +845,8 @@ class ImageProcessor:
                     for tag, value in ifd_data.items() if ifd_data else []:
                         # Decode the value before storing
                         decoded_value = self.decode_exif_value(value)
-                        tag_name = TAGS.get(tag, tag)
-                        if isinstance(
-                            decoded_value,
-                            (str, int, float, list, tuple, dict),
-                        ):
+                        tag_name = _TAGS_GET(tag, tag)
+                        if isinstance(decoded_value, _EXIF_ALLOWED_TYPES):
                             exif_data[f"{tag_name}"] = decoded_value
 
                         if exif_tags is not None:
@@ -772,11 +858,16 @@ class ImageProcessor:
             pass
 
     def _print_exif_data(self, exif_data: dict) -> None:
-        """Prints all decoded EXIF data."""
-        print(f"Second pass: Extracted EXIF data from {self.metadata.file_name}:")
+        """Logs all decoded EXIF data at DEBUG level.
+
+        Runs for every file in a scan, so the per-tag lines are only built
+        when DEBUG logging is enabled.
+        """
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        logger.debug("Extracted EXIF data from %s:", self.metadata.file_name)
         for key, value in exif_data.items():
-            print(f"  {key}: {value[:100] if isinstance(value, str) else value}")
-            pass
+            logger.debug("  %s: %s", key, value[:100] if isinstance(value, str) else value)
 
     def _extract_generation_text_fields(
         self,
@@ -1169,9 +1260,16 @@ class ImageProcessor:
 
         return None
 
-    def _get_metadata(self) -> tuple[int, int, Optional[str], dict, dict[str, Any]]:
-        """Extracts metadata from image/video files."""
+    def _get_metadata(
+        self, source: Any = None
+    ) -> tuple[int, int, Optional[str], dict, dict[str, Any]]:
+        """Extracts metadata from image/video files.
+
+        ``source`` is an optional already-open binary stream (or mmap) of the
+        file; when omitted the file is opened from ``metadata.file_path``.
+        """
         self._blurhash: Optional[str] = None
+        self._blurhash_pending = False
 
         # Non-image formats are handled via exiftool.
         if self.extension in {".mp4", ".webm", ".mov", ".mkv"}:
@@ -1180,19 +1278,20 @@ class ImageProcessor:
         try:
             if self.metadata.file_path is None:
                 return 0, 0, None, {}, {}
-            with Image.open(self.metadata.file_path) as img:
+            with self._open_image(
+                source if source is not None else self.metadata.file_path
+            ) as img:
                 width, height = img.size
                 mimetype = self._extract_mimetype(img)
+                # For PNG this also load()s the image, which is what pulls text
+                # chunks stored after IDAT into img.info, so it must run before
+                # the generation-text pass below.
                 exif_data_raw = img.getexif()
 
                 exif_data = {}
                 exif_tags: dict[str, Any] = {}
                 if exif_data_raw:
-                    for tag, value in exif_data_raw.items():
-                        tag_name = TAGS.get(tag, f"tag_{tag}")
-                        exif_tags[f"exif:{tag_name}"] = self._to_json_safe(value)
-
-                    exif_data = self._extract_standard_exif_tags(exif_data_raw)
+                    exif_data = self._extract_standard_exif_tags(exif_data_raw, exif_tags)
                     self._extract_ifd_exif_tags(exif_data_raw, exif_data, exif_tags)
 
                 # Also inspect text chunks (PNG/WebP/etc.) for generation metadata.
@@ -1200,34 +1299,66 @@ class ImageProcessor:
                 self._prune_ifd_pointer_tags(exif_data)
                 self._print_exif_data(exif_data)
 
-                # Compute blurhash while image is open.
-                if _blurhash_mod is not None:
-                    try:
-                        small = img.copy()
-                        small.thumbnail((128, 128), Image.LANCZOS)
-                        if small.mode != "RGB":
-                            small = small.convert("RGB")
-                        w, h = small.size
-                        raw = small.load()
-                        pixel_rows = [
-                            [raw[x, y] for x in range(w)]
-                            for y in range(h)
-                        ]
-                        self._blurhash = _blurhash_mod.encode(
-                            pixel_rows, components_x=4, components_y=3
-                        )
-                    except Exception:
-                        pass
+                # Everything above comes from the header/metadata chunks; the
+                # blurhash needs decoded pixels and is only stored on new
+                # records, so it is computed on demand (see compute_blurhash).
+                self._blurhash_pending = True
 
             return width, height, mimetype, exif_data, exif_tags
         except Exception:
             return self._extract_metadata_with_exiftool()
 
+    def _open_image(self, fp: Any) -> Image.Image:
+        """Opens ``fp`` (a path or binary stream), trying the plugin the
+        file's extension names first.
+
+        Falls back to PIL's full format probe when the content does not match
+        the extension (e.g. a PNG saved as ``.jpg``).
+        """
+        formats = _PIL_FORMAT_HINTS.get(self.extension or "")
+        if formats is not None:
+            try:
+                return Image.open(fp, formats=formats)
+            except UnidentifiedImageError:
+                if hasattr(fp, "seek"):
+                    fp.seek(0)
+        return Image.open(fp)
+
+    def compute_blurhash(self) -> Optional[str]:
+        """Returns the image's blurhash, decoding the file on first use.
+
+        Rescans build a processor for every library file but only new records
+        store a blurhash, so the pixel decode is deferred until it is needed;
+        scan() runs it on its workers for hashes it has not seen stored yet.
+        ``thumbnail()`` sets a decoder draft, letting JPEGs decode at reduced
+        scale instead of materialising the full-resolution frame.
+        """
+        if not self._blurhash_pending or _blurhash_mod is None:
+            return self._blurhash
+        self._blurhash_pending = False
+        try:
+            with self._open_image(self.original_path) as img:
+                img.thumbnail((128, 128), Image.LANCZOS)
+                small = img if img.mode == "RGB" else img.convert("RGB")
+                w, h = small.size
+                raw = small.load()
+                pixel_rows = [
+                    [raw[x, y] for x in range(w)]
+                    for y in range(h)
+                ]
+                self._blurhash = _blurhash_mod.encode(
+                    pixel_rows, components_x=4, components_y=3
+                )
+        except Exception:
+            pass
+        return self._blurhash
+
     def find_in_database(self) -> Optional[ImageModel]:
         """Finds the image in the database using its hash."""
         self.db_record = (
             self.db.query(ImageModel)
             .filter(ImageModel.file_hash == self.file_hash)
+            .order_by(ImageModel.id)
             .first()
         )
         return self.db_record
@@ -1238,9 +1369,12 @@ class ImageProcessor:
         final_absolute_path = Path(self.library_path) / final_filename
         print(f"Saving image to library: {final_absolute_path}")
 
-        # If the file is already in the right place with the right name, do nothing
+        # If the file is already in the right place with the right name, do nothing.
+        # Compare names first so the resolve() syscalls only run when the file
+        # could actually be the destination already.
         if (
             self.metadata.file_path
+            and Path(self.metadata.file_path).name == final_filename
             and Path(self.metadata.file_path).resolve() == final_absolute_path.resolve()
         ):
             return final_filename
@@ -1256,12 +1390,15 @@ class ImageProcessor:
         # Move the image file to its final destination
         if self.metadata.file_path is None:
             raise ValueError("File path is None, cannot save to library")
-        shutil.move(self.metadata.file_path, final_absolute_path)
+        self._move_file(Path(self.metadata.file_path), final_absolute_path)
+        # A rename keeps the inode; refresh the cached stat so
+        # create_database_record() does not need another syscall.
+        self.stat_result = final_absolute_path.stat()
 
         # Move the JSON file if it exists
         if original_json_path and original_json_path.exists():
             try:
-                shutil.move(original_json_path, final_json_path)
+                self._move_file(original_json_path, final_json_path)
                 print(f"Moved JSON metadata to: {final_json_path}")
             except Exception as e:
                 print(f"Warning: Could not move JSON metadata file: {e}")
@@ -1271,6 +1408,26 @@ class ImageProcessor:
 
         return final_filename
 
+    def _stat_path(self, path: Path) -> os.stat_result:
+        """Stats ``path``, reusing the fstat taken when this file was processed.
+
+        ``stat_result`` is refreshed by save_to_library(), so it stays valid
+        for ``original_path`` after a move; other paths are stat'ed afresh.
+        """
+        if self.stat_result is not None and path == self.original_path:
+            return self.stat_result
+        return path.stat()
+
+    @staticmethod
+    def _move_file(source: Path, destination: Path) -> None:
+        """Moves a file, using a single atomic rename when both paths share a filesystem."""
+        try:
+            os.replace(source, destination)
+        except OSError as exc:
+            if exc.errno != errno.EXDEV:
+                raise
+            shutil.move(str(source), str(destination))
+
     def delete_from_filesystem(self):
         """Deletes the image file from the filesystem."""
         if self.original_path.exists():
@@ -1287,8 +1444,7 @@ class ImageProcessor:
         json_metadata: Optional[dict[str, Any]] = None,
     ) -> ImageModel:
         """Creates a new ImageModel record."""
-        absolute_path = Path(self.library_path) / relative_filepath
-        stat = os.stat(absolute_path)
+        stat = self._stat_path(Path(self.library_path) / relative_filepath)
 
         display_name = sanitize_display_filename(
             original_filename or self.metadata.file_name or relative_filepath,
@@ -1327,7 +1483,7 @@ class ImageProcessor:
             a1111_adetailer=promoted["a1111_adetailer"],
             has_comfyui_metadata=promoted["has_comfyui_metadata"],
             has_generation_prompt=promoted["has_generation_prompt"],
-            blurhash=getattr(self, "_blurhash", None),
+            blurhash=self.compute_blurhash(),
         )
         return self.db_record
 
@@ -1444,7 +1600,7 @@ class ImageProcessor:
             additional_data: Optional additional metadata not in the database model
         """
         json_path = self._get_json_path(image_path)
-        stat = image_path.stat()
+        stat = self._stat_path(image_path)
 
         # Build the data structure from all available sources
         data: dict[str, Any] = {
@@ -1589,7 +1745,7 @@ class ImageProcessor:
                 loaded_data = json.load(f)
 
             # Get actual file stats
-            stat = image_path.stat()
+            stat = self._stat_path(image_path)
 
             # Start with loaded JSON data
             metadata = loaded_data.copy()
@@ -27,6 +27,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from datetime import datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from fastapi import (
     FastAPI,
     Depends,
@@ -50,7 +51,7 @@ from PIL import Image
 from sqlalchemy import text, func, or_, event
 import sqlalchemy as sa
 from sqlalchemy.exc import OperationalError
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, defer, joinedload
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from fastapi.middleware.gzip import GZipMiddleware
@@ -104,6 +105,7 @@ from image_processor import (
     is_exiftool_available,
     is_ffmpeg_available,
     sanitize_display_filename,
+    sha256_file,
 )
 from civitai_enrichment import (
     is_civitai_image_url,
@@ -2047,14 +2049,17 @@ def _guess_suffix(mime_type: Optional[str]) -> str:
 
 
 def _sha256_file(file_path: Path) -> str:
-    digest = hashlib.sha256()
-    with open(file_path, "rb") as handle:
-        while True:
-            chunk = handle.read(1024 * 1024)
-            if not chunk:
-                break
-            digest.update(chunk)
-    return digest.hexdigest()
+    return sha256_file(file_path)
+
+
+@lru_cache(maxsize=4096)
+def _sha256_file_for_stat(file_path: str, file_size: int, mtime_ns: int) -> str:
+    """Memoised ``sha256_file`` keyed on (path, size, mtime_ns).
+
+    Archived variant display items are rebuilt on every gallery request; a
+    file replaced in place gets a new key and is hashed again.
+    """
+    return sha256_file(file_path)
 
 
 def _detect_downloaded_media(file_path: Path) -> tuple[str, Optional[str]]:
@@ -8479,9 +8484,18 @@ def _hydrate_observations_from_payload(
         return
 
     now = datetime.utcnow()
-    _seen: set[tuple[int, int, int]] = set()
+    image_id = int(image.id)
+    new_rows: list[dict[str, Any]] = []
 
     try:
+        # Terms this image already has an observation for, loaded once
+        # instead of one existence query per term.
+        observed_term_ids = {
+            term_id
+            for (term_id,) in db.query(ImageConceptObservation.authority_term_id).filter(
+                ImageConceptObservation.image_id == image_id
+            )
+        }
         for source, tag_names in tags_by_source.items():
             if not tag_names:
                 continue
@@ -8505,41 +8519,28 @@ def _hydrate_observations_from_payload(
             )
 
             for term in terms:
-                concept_id = term.concept_id  # May be None for orphans
-
                 # Dedup by authority_term_id — one observation per term
-                obs_key = (int(image.id), int(term.id), authority_id)
-                if obs_key in _seen:
+                term_id = int(term.id)
+                if term_id in observed_term_ids:
                     continue
-
-                existing = (
-                    db.query(ImageConceptObservation.id)
-                    .filter(
-                        ImageConceptObservation.image_id == image.id,
-                        ImageConceptObservation.authority_term_id == term.id,
-                    )
-                    .first()
-                )
-                if existing is not None:
-                    _seen.add(obs_key)
-                    continue
-
-                db.add(
-                    ImageConceptObservation(
-                        image_id=int(image.id),
-                        concept_id=concept_id,
-                        authority_id=authority_id,
-                        authority_term_id=int(term.id),
-                        source_type=ObservationSource.IMPORT,
-                        certainty_label=ObservationCertainty.LIKELY,
-                        is_present=True,
-                        is_curated=False,
-                        created_at=now,
-                        updated_at=now,
-                    )
+                observed_term_ids.add(term_id)
+                new_rows.append(
+                    {
+                        "image_id": image_id,
+                        "concept_id": term.concept_id,  # May be None for orphans
+                        "authority_id": authority_id,
+                        "authority_term_id": term_id,
+                        "source_type": ObservationSource.IMPORT,
+                        "certainty_label": ObservationCertainty.LIKELY,
+                        "is_present": True,
+                        "is_curated": False,
+                        "created_at": now,
+                        "updated_at": now,
+                    }
                 )
-                _seen.add(obs_key)
 
+        if new_rows:
+            db.bulk_insert_mappings(ImageConceptObservation, new_rows)
         db.flush()
     except Exception as exc:
         db.rollback()
@@ -11439,8 +11440,11 @@ def _build_static_resource_variant(
         _, detected_mime = _detect_downloaded_media(resource_path)
         if detected_mime:
             mimetype = detected_mime
-        file_size = int(resource_path.stat().st_size)
-        file_hash = _sha256_file(resource_path)
+        resource_stat = resource_path.stat()
+        file_size = int(resource_stat.st_size)
+        file_hash = _sha256_file_for_stat(
+            str(resource_path), resource_stat.st_size, resource_stat.st_mtime_ns
+        )
 
     if mimetype.startswith("image/"):
         current_suffix = Path(file_name).suffix.lower()
@@ -11450,8 +11454,13 @@ def _build_static_resource_variant(
             if canonical_path.exists() and canonical_path.is_file():
                 resource_path = canonical_path
                 relative_path = str(resource_path.relative_to(resources_root))
-                file_size = int(resource_path.stat().st_size)
-                file_hash = _sha256_file(resource_path)
+                resource_stat = resource_path.stat()
+                file_size = int(resource_stat.st_size)
+                file_hash = _sha256_file_for_stat(
+                    str(resource_path),
+                    resource_stat.st_size,
+                    resource_stat.st_mtime_ns,
+                )
                 file_name = resource_path.name
             else:
                 file_name = f"{Path(file_name).stem}{canonical_suffix}"
@@ -11730,6 +11739,53 @@ def _build_flat_variant_display_items(
     return flat_items
 
 
+# Gallery list pages only read a few artist/collection columns and never the
+# EXIF blob (detail-only, fetched via GET /api/images/{id}), so load just those.
+_GALLERY_LIST_LOAD_OPTIONS = (
+    defer(ImageModel.exif_data),
+    joinedload(ImageModel.artist).load_only(
+        Artist.name,
+        Artist.civitai_user_deleted,
+        Artist.civitai_user_original_name,
+    ),
+    joinedload(ImageModel.collections).load_only(CollectionModel.name),
+)
+
+
+def _load_civitai_tags_by_image_id(
+    db: Session, image_ids: list[int]
+) -> dict[int, list[str]]:
+    """Map image id -> CivitAI tag names (from image_concept_observations).
+
+    Batched replacement for a per-image lookup in the gallery list loops:
+    one query per 500 ids, names ordered as the per-image query returned them.
+    """
+    tags_by_image_id: dict[int, list[str]] = {}
+    _CHUNK = 500
+    for start in range(0, len(image_ids), _CHUNK):
+        chunk = image_ids[start : start + _CHUNK]
+        rows = (
+            db.query(ImageConceptObservation.image_id, AuthorityTerm.external_name)
+            .join(
+                AuthorityTerm,
+                ImageConceptObservation.authority_term_id == AuthorityTerm.id,
+            )
+            .join(TagAuthority, TagAuthority.id == AuthorityTerm.authority_id)
+            .filter(
+                ImageConceptObservation.image_id.in_(chunk),
+                TagAuthority.name == "civitai",
+            )
+            .order_by(
+                ImageConceptObservation.image_id,
+                AuthorityTerm.external_name.asc(),
+            )
+        )
+        for image_id, external_name in rows:
+            if external_name:
+                tags_by_image_id.setdefault(image_id, []).append(external_name)
+    return tags_by_image_id
+
+
 def _build_display_items_for_image(
     image: ImageModel,
     merged_payload: dict[str, Any],
@@ -12029,11 +12085,7 @@ def _load_display_image_items_unified(
 
     images_query = (
         db.query(ImageModel)
-        .options(
-            joinedload(ImageModel.artist),
-            joinedload(ImageModel.license),
-            joinedload(ImageModel.collections),
-        )
+        .options(*_GALLERY_LIST_LOAD_OPTIONS)
         .filter(_active_image_filter())
     )
 
@@ -12131,9 +12183,12 @@ def _load_display_image_items_unified(
         except Exception:
             pass
 
+    civitai_tags_by_image_id = _load_civitai_tags_by_image_id(
+        db, [image.id for image in images]
+    )
     display_items: list[dict[str, Any]] = []
     for image in images:
-        db_dict = ImageData.from_db_record(image).to_dict()
+        db_dict = ImageData.from_db_record(image, include_exif=False).to_dict()
         db_dict["exif_data"] = None
         db_dict["civitai_data"] = None
         db_dict["json_metadata"] = None
@@ -12166,22 +12221,8 @@ def _load_display_image_items_unified(
         if isinstance(db_user_neg_tags, list) and db_user_neg_tags:
             merged["user_negative_tags"] = db_user_neg_tags
         
-        # Query CivitAI tags from image_concept_observations (post-backfill data)
-        civitai_tag_rows = (
-            db.query(AuthorityTerm.external_name)
-            .join(
-                ImageConceptObservation,
-                ImageConceptObservation.authority_term_id == AuthorityTerm.id,
-            )
-            .join(TagAuthority, TagAuthority.id == AuthorityTerm.authority_id)
-            .filter(
-                ImageConceptObservation.image_id == image.id,
-                TagAuthority.name == "civitai",
-            )
-            .order_by(AuthorityTerm.external_name.asc())
-            .all()
-        )
-        merged["civitai_tags"] = [row[0] for row in civitai_tag_rows if row[0]]
+        # CivitAI tags from image_concept_observations (post-backfill data)
+        merged["civitai_tags"] = civitai_tags_by_image_id.get(image.id, [])
         
         display_items.extend(
             _build_display_items_for_image(
@@ -12317,11 +12358,7 @@ def _load_display_image_items(
 
     images_query = (
         db.query(ImageModel)
-        .options(
-            joinedload(ImageModel.artist),
-            joinedload(ImageModel.license),
-            joinedload(ImageModel.collections),
-        )
+        .options(*_GALLERY_LIST_LOAD_OPTIONS)
         .filter(_active_image_filter())
     )
     images_query = _apply_image_list_filters(
@@ -12506,9 +12543,12 @@ def _load_display_image_items(
             # silently fall back to legacy hash-based grouping.
             pass
 
+    civitai_tags_by_image_id = _load_civitai_tags_by_image_id(
+        db, [image.id for image in images]
+    )
     display_items: list[dict[str, Any]] = []
     for image in images:
-        db_dict = ImageData.from_db_record(image).to_dict()
+        db_dict = ImageData.from_db_record(image, include_exif=False).to_dict()
 
         # DB-only display: no sidecar reads.  All gallery-critical fields
         # come from DB columns or json_metadata (a JSON column).
@@ -12550,22 +12590,8 @@ def _load_display_image_items(
         if isinstance(db_user_neg_tags, list) and db_user_neg_tags:
             merged["user_negative_tags"] = db_user_neg_tags
 
-        # Query CivitAI tags from image_concept_observations (post-backfill data)
-        civitai_tag_rows = (
-            db.query(AuthorityTerm.external_name)
-            .join(
-                ImageConceptObservation,
-                ImageConceptObservation.authority_term_id == AuthorityTerm.id,
-            )
-            .join(TagAuthority, TagAuthority.id == AuthorityTerm.authority_id)
-            .filter(
-                ImageConceptObservation.image_id == image.id,
-                TagAuthority.name == "civitai",
-            )
-            .order_by(AuthorityTerm.external_name.asc())
-            .all()
-        )
-        merged["civitai_tags"] = [row[0] for row in civitai_tag_rows if row[0]]
+        # CivitAI tags from image_concept_observations (post-backfill data)
+        merged["civitai_tags"] = civitai_tags_by_image_id.get(image.id, [])
 
         display_items.extend(
             _build_display_items_for_image(
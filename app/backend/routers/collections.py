@@ -12,7 +12,7 @@ Extracted from main.py:
 
 Helper functions co-located here:
   _isoformat_or_none, _normalize_collection_name, _serialize_collection,
-  _ensure_image_in_collection
+  _ensure_image_in_collection, _collection_member_ids
 
 TODO: Move sync-lab helpers (_resolve_civitai_image_target, _download_*,
       _ingest_*, _archive_*, etc.) from main.py into services/civitai_service.py
@@ -21,7 +21,10 @@ TODO: Move sync-lab helpers (_resolve_civitai_image_target, _download_*,
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
+import tempfile
 from pathlib import Path
 from typing import Any, List, Optional
 
@@ -57,6 +60,9 @@ from utils.cache import (
 
 router = APIRouter(tags=["collections"])
 
+# Read size used when streaming uploaded files to the library staging area.
+_UPLOAD_CHUNK_SIZE = 1 << 20
+
 
 # ---------------------------------------------------------------------------
 # Draft-post fallback helper (shared between Sync Lab and import pipeline)
@@ -208,6 +214,21 @@ def _ensure_image_in_collection(db: Session, image_id: int, collection_id: int)
     db.flush()
 
 
+def _collection_member_ids(
+    db: Session, collection_id: int, image_ids: List[int]
+) -> set[int]:
+    """Returns which of ``image_ids`` already belong to the collection (one query)."""
+    if not image_ids:
+        return set()
+    return {
+        image_id
+        for (image_id,) in db.query(ImageCollectionMembership.image_id).filter(
+            ImageCollectionMembership.collection_id == collection_id,
+            ImageCollectionMembership.image_id.in_(image_ids),
+        )
+    }
+
+
 # ---------------------------------------------------------------------------
 # Collection CRUD
 # ---------------------------------------------------------------------------
@@ -365,27 +386,18 @@ def add_images_to_collection(
         file_hash for file_hash in normalized_hashes if file_hash not in images_by_hash
     ]
 
-    added_count = 0
-    already_member_count = 0
-    for file_hash in normalized_hashes:
-        image = images_by_hash.get(file_hash)
-        if image is None:
-            continue
-
-        existing = (
-            db.query(ImageCollectionMembership)
-            .filter(
-                ImageCollectionMembership.image_id == image.id,
-                ImageCollectionMembership.collection_id == collection_id,
-            )
-            .first()
-        )
-        if existing is not None:
-            already_member_count += 1
-            continue
-
-        _ensure_image_in_collection(db, image.id, collection_id)
-        added_count += 1
+    member_ids = _collection_member_ids(
+        db, collection_id, [image.id for image in images_by_hash.values()]
+    )
+    new_rows = [
+        {"image_id": image.id, "collection_id": collection_id}
+        for image in images_by_hash.values()
+        if image.id not in member_ids
+    ]
+    added_count = len(new_rows)
+    already_member_count = len(images_by_hash) - added_count
+    if new_rows:
+        db.bulk_insert_mappings(ImageCollectionMembership, new_rows)
 
     db.commit()
     return {
@@ -462,27 +474,16 @@ def remove_images_from_collection(
         file_hash for file_hash in normalized_hashes if file_hash not in images_by_hash
     ]
 
-    removed_count = 0
-    not_member_count = 0
-    for file_hash in normalized_hashes:
-        image = images_by_hash.get(file_hash)
-        if image is None:
-            continue
-
-        membership = (
-            db.query(ImageCollectionMembership)
-            .filter(
-                ImageCollectionMembership.image_id == image.id,
-                ImageCollectionMembership.collection_id == collection_id,
-            )
-            .first()
-        )
-        if membership is None:
-            not_member_count += 1
-            continue
-
-        db.delete(membership)
-        removed_count += 1
+    member_ids = _collection_member_ids(
+        db, collection_id, [image.id for image in images_by_hash.values()]
+    )
+    removed_count = len(member_ids)
+    not_member_count = len(images_by_hash) - removed_count
+    if member_ids:
+        db.query(ImageCollectionMembership).filter(
+            ImageCollectionMembership.collection_id == collection_id,
+            ImageCollectionMembership.image_id.in_(member_ids),
+        ).delete(synchronize_session=False)
 
     db.commit()
     return {
@@ -553,10 +554,10 @@ def get_licenses(
     if _should_return_json_not_modified(request, cache_headers):
         return Response(status_code=304, headers=cache_headers)
 
-    licenses = db.query(License).all()
+    rows = db.query(License.id, License.name, License.short_name).all()
     return [
-        {"id": license.id, "name": license.name, "short_name": license.short_name}
-        for license in licenses
+        {"id": license_id, "name": name, "short_name": short_name}
+        for license_id, name, short_name in rows
     ]
 
 
@@ -582,6 +583,33 @@ def scan_library(db: Session = Depends(get_db)):
         )
 
 
+def _stage_upload(file: UploadFile, library_path: str) -> tuple[Path, str]:
+    """Copy an upload to a unique temp file in the library, hashing it on the way.
+
+    Reads the spooled upload synchronously, so call it from a worker thread.
+    Staging inside the library keeps the final move a same-filesystem rename,
+    and the client-supplied filename never becomes part of a path.
+    """
+    digest = hashlib.sha256()
+    with tempfile.NamedTemporaryFile(
+        mode="wb",
+        dir=library_path,
+        prefix="temp_",
+        suffix=Path(file.filename or "").suffix.lower(),
+        delete=False,
+    ) as out:
+        temp_path = Path(out.name)
+        try:
+            while chunk := file.file.read(_UPLOAD_CHUNK_SIZE):
+                out.write(chunk)
+                digest.update(chunk)
+        except BaseException:
+            out.close()
+            temp_path.unlink(missing_ok=True)
+            raise
+    return temp_path, digest.hexdigest()
+
+
 @router.post("/upload_images/")
 async def upload_images(
     files: List[UploadFile] = File(...),
@@ -593,40 +621,97 @@ async def upload_images(
     """Uploads one or more images, saves them to the library, and adds them to the database."""
     from main import IMAGE_LIBRARY_PATH, _commit_with_lock_retry, _get_runtime_warnings  # noqa: PLC0415
     from image_collection import ImageCollection  # noqa: PLC0415
+    from image_processor import ImageProcessor  # noqa: PLC0415
 
     images_added = 0
     images_skipped = 0
     json_files_created = 0
     errors = []
 
-    for file in files:
-        temp_path = None
-        try:
-            contents = await file.read()
-            temp_path = Path(IMAGE_LIBRARY_PATH) / f"temp_{file.filename}"
-            temp_path.write_bytes(contents)
+    staged: List[tuple[UploadFile, Path, str]] = []
+    try:
+        # Copy and hash every upload in worker threads, concurrently.
+        stage_results = await asyncio.gather(
+            *(
+                asyncio.to_thread(_stage_upload, file, IMAGE_LIBRARY_PATH)
+                for file in files
+            ),
+            return_exceptions=True,
+        )
+        for file, stage_result in zip(files, stage_results):
+            if isinstance(stage_result, BaseException):
+                errors.append(f"Could not process {file.filename}: {stage_result}")
+                continue
+            temp_path, file_hash = stage_result
+            staged.append((file, temp_path, file_hash))
+
+        # EXIF decoding and blurhash are the expensive part of an upload; run
+        # them for all files in worker threads so they overlap and stay off
+        # the event loop. DB ingestion below stays sequential on the request's
+        # session.
+        def build_processor(temp_path: Path, file_hash: str) -> ImageProcessor:
+            processor = ImageProcessor(
+                str(temp_path), db, IMAGE_LIBRARY_PATH, file_hash=file_hash
+            )
+            # Uploads are mostly new records, which store the blurhash.
+            processor.compute_blurhash()
+            return processor
+
+        processors = await asyncio.gather(
+            *(
+                asyncio.to_thread(build_processor, temp_path, file_hash)
+                for _, temp_path, file_hash in staged
+            ),
+            return_exceptions=True,
+        )
 
-            collection = ImageCollection(db)
+        # Resolve duplicates for the whole batch with one IN query instead of
+        # one lookup per file.
+        collection = ImageCollection(db)
+        existing_by_hash = collection.find_existing_by_hash(
+            file_hash for _, _, file_hash in staged
+        )
+
+        def ingest(
+            file: UploadFile, temp_path: Path, file_hash: str, processor: ImageProcessor
+        ) -> dict[str, Any]:
             ingest_result = collection.ingest_uploaded_file(
                 uploaded_file_path=temp_path,
                 original_filename=file.filename or temp_path.name,
                 artist_name=artist_name,
                 source_url=source_url,
                 license_id=license_id,
+                processor=processor,
+                existing_by_hash=existing_by_hash,
             )
-
-            images_added += int(ingest_result.get("images_added", 0))
-            images_skipped += int(ingest_result.get("images_skipped", 0))
-            json_files_created += int(ingest_result.get("json_files_created", 0))
+            # A later copy of the same file in this batch must see the
+            # row this one may have just created, so look it up again.
+            existing_by_hash.pop(file_hash, None)
             _commit_with_lock_retry(db, context=f"Upload commit for {file.filename}")
+            return ingest_result
 
-        except ValueError as e:
-            errors.append(str(e))
-        except Exception as e:
-            errors.append(f"Could not process {file.filename}: {e}")
-        finally:
-            if temp_path and temp_path.exists():
-                temp_path.unlink(missing_ok=True)
+        # Files are ingested one at a time (they share the session), but each
+        # runs in a worker thread so file moves, sidecar writes and commit
+        # retries don't block the event loop.
+        for (file, temp_path, file_hash), processor in zip(staged, processors):
+            try:
+                if isinstance(processor, BaseException):
+                    raise processor
+
+                ingest_result = await asyncio.to_thread(
+                    ingest, file, temp_path, file_hash, processor
+                )
+                images_added += int(ingest_result.get("images_added", 0))
+                images_skipped += int(ingest_result.get("images_skipped", 0))
+                json_files_created += int(ingest_result.get("json_files_created", 0))
+
+            except ValueError as e:
+                errors.append(str(e))
+            except Exception as e:
+                errors.append(f"Could not process {file.filename}: {e}")
+    finally:
+        for _, temp_path, _ in staged:
+            temp_path.unlink(missing_ok=True)
 
     runtime_warnings = _get_runtime_warnings()
     return {
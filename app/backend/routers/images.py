@@ -970,17 +970,33 @@ def get_artists(
     if _should_return_json_not_modified(request, cache_headers):
         return Response(status_code=304, headers=cache_headers)
 
-    artists = db.query(Artist).all()
+    # Project just the returned columns; plain rows skip ORM identity-map
+    # bookkeeping, which matters once CivitAI sync has created many artists.
+    rows = db.query(
+        Artist.id,
+        Artist.name,
+        Artist.nickname,
+        Artist.civitai_user_id,
+        Artist.civitai_user_deleted,
+        Artist.civitai_user_original_name,
+    ).all()
     return [
         {
-            "id": artist.id,
-            "name": artist.name,
-            "nickname": artist.nickname,
-            "civitai_user_id": artist.civitai_user_id,
-            "civitai_user_deleted": artist.civitai_user_deleted,
-            "civitai_user_original_name": artist.civitai_user_original_name,
+            "id": artist_id,
+            "name": name,
+            "nickname": nickname,
+            "civitai_user_id": civitai_user_id,
+            "civitai_user_deleted": civitai_user_deleted,
+            "civitai_user_original_name": civitai_user_original_name,
         }
-        for artist in artists
+        for (
+            artist_id,
+            name,
+            nickname,
+            civitai_user_id,
+            civitai_user_deleted,
+            civitai_user_original_name,
+        ) in rows
     ]
 
 
@@ -43,12 +43,12 @@ class MigrationUpdate:
 def _sha256_file(path: Path) -> str:
     import hashlib
 
-    hasher = hashlib.sha256()
     with open(path, "rb") as handle:
-        while True:
-            chunk = handle.read(1024 * 1024)
-            if not chunk:
-                break
+        if hasattr(hashlib, "file_digest"):
+            # Python 3.11+: read/update loop runs in C with the GIL released.
+            return hashlib.file_digest(handle, "sha256").hexdigest()
+        hasher = hashlib.sha256()
+        while chunk := handle.read(1024 * 1024):
             hasher.update(chunk)
     return hasher.hexdigest()
 
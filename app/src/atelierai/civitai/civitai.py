@@ -1,11 +1,77 @@
 import os
 import json
-import time
-from typing import Callable, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
 
 from .http_client import CivitaiRequestError
 
-from .civitai_api import CivitaiAPI
+from .civitai_api import CivitaiAPI, _json_dumps_compact
+
+# Stand-in cursor value used when pre-serializing collection page payloads.
+_CURSOR_PLACEHOLDER = "__CURSOR__"
+
+# Shared read-only fallback for optional nested objects (never mutated).
+_EMPTY_MAPPING: Dict[str, Any] = {}
+
+# Original-resolution media URL, formatted with (url hash, file name).
+_ORIGINAL_MEDIA_URL = (
+    "https://image.civitai.com/xG1nkqKTMzGDvpLrqFT7WA/{}/original=true/{}"
+).format
+
+_MIME_EXTENSIONS = {
+    "image/png": ".png",
+    "image/webp": ".webp",
+    "image/jpeg": ".jpeg",
+    "image/jpg": ".jpeg",
+    "image/tiff": ".tif",
+    "video/mp4": ".mp4",
+}
+
+
+@lru_cache(maxsize=256)
+def _extension_from_mime(mime_type: Optional[str]) -> str:
+    """Maps a CivitAI mime type to the desired file extension (memoized)."""
+    if not mime_type:
+        return ".jpeg"  # Default fallback
+
+    mime_lower = mime_type.lower()
+    known = _MIME_EXTENSIONS.get(mime_lower)
+    if known:
+        return known
+
+    if "png" in mime_lower:
+        return ".png"
+    elif "webp" in mime_lower:
+        return ".webp"
+    elif "tiff" in mime_lower or "tif" in mime_lower:
+        return ".tif"
+    elif "mp4" in mime_lower:
+        return ".mp4"
+    elif "jpeg" in mime_lower or "jpg" in mime_lower:
+        return ".jpeg"
+    else:
+        # Fallback for unknown types
+        return ".jpeg"
+
+
+@lru_cache(maxsize=256)
+def _resource_type(model_type: Any, type_: Any, model_name: Any) -> str:
+    """Determines a resource type from its type fields and name (memoized)."""
+    if model_type:
+        return model_type.lower()
+
+    if type_:
+        return type_.lower()
+
+    name_res = (model_name or "").lower()
+    if "lora" in name_res:
+        return "lora"
+    elif "checkpoint" in name_res:
+        return "checkpoint"
+
+    return "model"
 
 
 class CivitaiPrivateScraper:
@@ -22,6 +88,9 @@ class CivitaiPrivateScraper:
         data = scraper.scrape(collection_id, limit=50)
     """
 
+    # How long cached generation data / tags stay acceptable for scrape().
+    DETAILS_CACHE_MAX_AGE = timedelta(days=7)
+
     def __init__(self, session_cookie=None, auto_authenticate=False):
         """Initialize the scraper with the user's session cookie.
 
@@ -34,6 +103,9 @@ class CivitaiPrivateScraper:
         self.api = CivitaiAPI(
             session_cookie=session_cookie, auto_authenticate=auto_authenticate
         )
+        # Pre-serialized image.getInfinite inputs keyed by collection ID:
+        # (first-page payload, later-page payload with a cursor placeholder).
+        self._collection_payload_templates: Dict[int, tuple] = {}
 
     # ==========================================
     # Collection Fetching with Pagination
@@ -65,7 +137,7 @@ class CivitaiPrivateScraper:
         payload_data = {**self.api.default_params}
         payload_data["collectionId"] = int(collection_id)
         payload_data["cursor"] = cursor
-        params = {"input": self._build_trpc_payload(payload_data)}
+        params = {"input": self._collection_page_input(int(collection_id), cursor)}
 
         if debug:
             print(f"  DEBUG: Request URL: {self.api.base_url}/{endpoint}")
@@ -73,7 +145,9 @@ class CivitaiPrivateScraper:
             print(f"  DEBUG: TRPC Payload: {params}")
 
         try:
-            data = self.api._make_raw_request(endpoint, payload_data, strict=True)
+            data = self.api._make_raw_request(
+                endpoint, payload_data, strict=True, trpc_input=params["input"]
+            )
         except CivitaiRequestError as exc:
             print(f"Error fetching collection page: {exc}")
             return None, None
@@ -92,15 +166,43 @@ class CivitaiPrivateScraper:
 
         return data, next_cursor
 
+    def _collection_page_input(self, collection_id: int, cursor: Optional[str]) -> str:
+        """Return the serialized tRPC input for one collection page.
+
+        The payload is identical for every page except the cursor, so it is
+        serialized once per collection and the cursor is spliced in.
+        """
+        templates = self._collection_payload_templates.get(collection_id)
+        if templates is None:
+            payload_data = {**self.api.default_params}
+            payload_data["collectionId"] = collection_id
+            payload_data["cursor"] = None
+            first_page = self._build_trpc_payload(payload_data)
+            payload_data["cursor"] = _CURSOR_PLACEHOLDER
+            next_page = self._build_trpc_payload(payload_data)
+            templates = (first_page, next_page)
+            self._collection_payload_templates[collection_id] = templates
+
+        first_page, next_page = templates
+        if cursor is None:
+            return first_page
+        return next_page.replace(
+            _json_dumps_compact(_CURSOR_PLACEHOLDER), _json_dumps_compact(cursor), 1
+        )
+
     def _check_duplicates(self, page_items: List[Dict], seen_item_ids: set) -> bool:
         """Check if page contains duplicate items from previous pages.
 
         Returns:
             True if duplicates detected, False otherwise
         """
-        new_item_ids = {item.get("id") for item in page_items}
-        duplicate_count = len(new_item_ids & seen_item_ids)
+        page_item_ids = [item.get("id") for item in page_items]
+        # isdisjoint() stops at the first hit and needs no temporary set;
+        # the exact count is only computed on the (rare) duplicate path.
+        if seen_item_ids.isdisjoint(page_item_ids):
+            return False
 
+        duplicate_count = len(seen_item_ids.intersection(page_item_ids))
         if duplicate_count > 0:
             print(
                 f"  ⚠️  Cursor pagination bug detected: {duplicate_count}/{len(page_items)} items are duplicates."
@@ -146,56 +248,79 @@ class CivitaiPrivateScraper:
             print(f"Fetching items for CivitAI{type_qualifier} Collection: {collection_id}")
         self._debug_session_token(debug)
 
-        while True:
-            # Check if we've hit the limit
-            if limit is not None and len(items) >= limit:
-                print(f"  Reached limit of {limit} items.")
-                break
-
-            # Make API request
-            data, next_cursor = self._make_collection_request(
-                collection_id, cursor, debug
-            )
-            if data is None:
-                break
+        # One worker fetches page K+1 while page K is recorded and reported.
+        # Requests still go through the HTTP client's FIFO queue, so pacing is
+        # unchanged; only the local work overlaps the wait.
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            pending = None
+            while True:
+                # Check if we've hit the limit
+                if limit is not None and len(items) >= limit:
+                    print(f"  Reached limit of {limit} items.")
+                    break
+
+                # Make API request (or collect the one started last page)
+                if pending is not None:
+                    data, next_cursor = pending.result()
+                    pending = None
+                else:
+                    data, next_cursor = self._make_collection_request(
+                        collection_id, cursor, debug
+                    )
+                if data is None:
+                    break
+
+                # Parse items from response, then drop the envelope so only the
+                # item list stays alive while the next page is in flight.
+                page_items = self._find_infinite_items(data)
+                data = None
+                if not page_items:
+                    break
+
+                # Check for duplicates before prefetching, so a page that ends
+                # the loop does not spend a paced request on the next one.
+                if self._check_duplicates(page_items, seen_item_ids):
+                    print(
+                        f"  Stopping at {len(items)} unique items to avoid infinite loop."
+                    )
+                    break
+
+                has_next = bool(next_cursor) and next_cursor != cursor
+                if has_next and (
+                    limit is None or len(items) + len(page_items) < limit
+                ):
+                    pending = prefetcher.submit(
+                        self._make_collection_request,
+                        collection_id,
+                        next_cursor,
+                        debug,
+                    )
+
+                seen_item_ids.update(item.get("id") for item in page_items)
+
+                # Add items (respect limit)
+                remaining = limit - len(items) if limit else None
+                if remaining is not None and len(page_items) > remaining:
+                    page_items = page_items[:remaining]
+                    items.extend(page_items)
+                    if progress_callback is not None:
+                        progress_callback(page_count + 1, len(page_items), len(items))
+                    print(f"  Reached limit of {limit} items.")
+                    break
 
-            # Parse items from response
-            page_items = self._find_deep_image_list(data)
-            if not page_items:
-                break
-
-            # Check for duplicates
-            if self._check_duplicates(page_items, seen_item_ids):
-                print(
-                    f"  Stopping at {len(items)} unique items to avoid infinite loop."
-                )
-                break
-
-            seen_item_ids.update({item.get("id") for item in page_items})
-
-            # Add items (respect limit)
-            remaining = limit - len(items) if limit else None
-            if remaining is not None and len(page_items) > remaining:
-                page_items = page_items[:remaining]
                 items.extend(page_items)
+                page_count += 1
                 if progress_callback is not None:
-                    progress_callback(page_count + 1, len(page_items), len(items))
-                print(f"  Reached limit of {limit} items.")
-                break
-
-            items.extend(page_items)
-            page_count += 1
-            if progress_callback is not None:
-                progress_callback(page_count, len(page_items), len(items))
-            print(
-                f"  Page {page_count}: Fetched {len(page_items)} items (total: {len(items)})"
-            )
+                    progress_callback(page_count, len(page_items), len(items))
+                print(
+                    f"  Page {page_count}: Fetched {len(page_items)} items (total: {len(items)})"
+                )
 
-            # Check for next cursor
-            if next_cursor and next_cursor != cursor:
-                cursor = next_cursor
-            else:
-                break
+                # Check for next cursor
+                if has_next:
+                    cursor = next_cursor
+                else:
+                    break
 
         print(f"Found {len(items)} total items ({len(seen_item_ids)} unique).")
         return items
@@ -222,34 +347,49 @@ class CivitaiPrivateScraper:
         if not collection_items:
             return []
 
-        curated_data = []
-        print(f"Fetching details for {len(collection_items)} images...")
-
-        for idx, item in enumerate(collection_items):
-            img_id = item.get("id")
-            if img_id is None:
-                print(
-                    f"  [{idx+1}/{len(collection_items)}] Skipping item without ID..."
-                )
-                continue
-            print(f"  [{idx+1}/{len(collection_items)}] Processing ID {img_id}...")
+        total = len(collection_items)
+        print(f"Fetching details for {total} images...")
 
-            details = self.api.fetch_generation_data(img_id)
-
-            if details:
-                merged = self._merge_data(item, details)
+        # Requests are paced by CivitaiHttpClient's single-consumer FIFO queue,
+        # so items are fetched in turn with no extra sleep between them.
+        curated_data = []
+        for position, item in enumerate(collection_items, start=1):
+            merged = self._scrape_item(position, total, item)
+            if merged is not None:
+                curated_data.append(merged)
 
-                # Fetch tags for this image using CivitaiAPI
-                tags = self.api.fetch_image_tags(img_id)
-                merged["tags"] = tags
-                if tags:
-                    print(f"    - Found {len(tags)} tags")
+        return curated_data
 
-                curated_data.append(merged)
+    def _scrape_item(self, position: int, total: int, item: Dict) -> Optional[Dict]:
+        """Fetch generation data and tags for one collection item and merge them."""
+        img_id = item.get("id")
+        if img_id is None:
+            print(f"  [{position}/{total}] Skipping item without ID...")
+            return None
+        print(f"  [{position}/{total}] Processing ID {img_id}...")
+
+        # Cache-first: re-scrapes of a collection reuse the responses
+        # already stored in the CivitAI response cache.
+        details = self.api.fetch_generation_data_cached(
+            img_id, max_age=self.DETAILS_CACHE_MAX_AGE
+        )
+        if not details:
+            return None
 
-            time.sleep(0.2)
+        merged = self._merge_data(item, details)
 
-        return curated_data
+        # Fetch tags for this image using CivitaiAPI
+        tags = [
+            str(tag.get("name"))
+            for tag in self.api.fetch_image_tag_records_cached(
+                img_id, max_age=self.DETAILS_CACHE_MAX_AGE
+            )
+            if isinstance(tag.get("name"), str)
+        ]
+        merged["tags"] = tags
+        if tags:
+            print(f"    - Found {len(tags)} tags")
+        return merged
 
     # ==========================================
     # Helper Methods (Aliased from CivitaiAPI)
@@ -259,6 +399,10 @@ class CivitaiPrivateScraper:
         """Delegate to API's _build_trpc_payload method."""
         return self.api._build_trpc_payload(payload_data)
 
+    def _find_infinite_items(self, obj) -> Optional[List]:
+        """Delegate to API's _find_infinite_items method."""
+        return self.api._find_infinite_items(obj)
+
     def _find_deep_image_list(self, obj, depth: int = 0) -> Optional[List]:
         """Delegate to API's _find_deep_image_list method."""
         return self.api._find_deep_image_list(obj, depth)
@@ -286,24 +430,7 @@ class CivitaiPrivateScraper:
 
     def _get_extension_from_mime(self, mime_type: str) -> str:
         """Maps CivitAI mime types to the desired file extension."""
-        if not mime_type:
-            return ".jpeg"  # Default fallback
-
-        mime_lower = mime_type.lower()
-
-        if "png" in mime_lower:
-            return ".png"
-        elif "webp" in mime_lower:
-            return ".webp"
-        elif "tiff" in mime_lower or "tif" in mime_lower:
-            return ".tif"
-        elif "mp4" in mime_lower:
-            return ".mp4"
-        elif "jpeg" in mime_lower or "jpg" in mime_lower:
-            return ".jpeg"
-        else:
-            # Fallback for unknown types
-            return ".jpeg"
+        return _extension_from_mime(mime_type)
 
     def _sanitize_filename_extension(self, name: str, mime_type: str) -> str:
         """
@@ -315,7 +442,17 @@ class CivitaiPrivateScraper:
             return f"unknown{self._get_extension_from_mime(mime_type)}"
 
         # Get the expected extension based on the API mime type
-        target_ext = self._get_extension_from_mime(mime_type)
+        target_ext = _extension_from_mime(mime_type)
+
+        # Fast path: the name already ends with the expected extension (the
+        # common case), so skip splitext. The stem must contain a non-dot
+        # character, matching how splitext treats dotfiles like ".jpeg".
+        ext_len = len(target_ext)
+        if (
+            name[-ext_len:].lower() == target_ext
+            and name[:-ext_len].rpartition("/")[2].strip(".")
+        ):
+            return name
 
         # Split the current name into root and extension
         base_name, current_ext = os.path.splitext(name)
@@ -338,21 +475,7 @@ class CivitaiPrivateScraper:
 
     def _get_resource_type(self, res: Dict) -> str:
         """Determines the resource type with fallback detection."""
-        type_ = res.get("modelType")
-        if type_:
-            return type_.lower()
-
-        type_ = res.get("type")
-        if type_:
-            return type_.lower()
-
-        name_res = res.get("modelName", "").lower()
-        if "lora" in name_res:
-            return "lora"
-        elif "checkpoint" in name_res:
-            return "checkpoint"
-
-        return "model"
+        return _resource_type(res.get("modelType"), res.get("type"), res.get("modelName", ""))
 
     def _process_resources(self, resources: List[Dict]) -> tuple:
         """Extracts model and lora information from resources list.
@@ -366,30 +489,30 @@ class CivitaiPrivateScraper:
 
         for res in resources:
             type_lower = self._get_resource_type(res)
-            raw_name_res = res.get("modelName")
-            name_res = str(raw_name_res) if raw_name_res is not None else ""
-            weight = res.get("strength") or 1.0
-            raw_version_name = res.get("versionName")
-            version_name = str(raw_version_name) if raw_version_name is not None else ""
-            model_id = res.get("modelId")
-            model_version_id = res.get("modelVersionId") or res.get("versionId")
-
             if type_lower == "lora":
+                raw_name_res = res.get("modelName")
+                raw_version_name = res.get("versionName")
                 loras.append(
                     {
-                        "name": name_res,
-                        "weight": weight,
-                        "model_id": model_id,
-                        "model_version_id": model_version_id,
-                        "version_name": version_name,
+                        "name": str(raw_name_res) if raw_name_res is not None else "",
+                        "weight": res.get("strength") or 1.0,
+                        "model_id": res.get("modelId"),
+                        "model_version_id": res.get("modelVersionId") or res.get("versionId"),
+                        "version_name": (
+                            str(raw_version_name) if raw_version_name is not None else ""
+                        ),
                     }
                 )
-            elif type_lower == "checkpoint":
-                model_name = name_res
-                model_version = version_name or ""
-            elif type_lower == "model" and (not model_name or model_name == "Unknown"):
-                model_name = name_res
-                model_version = version_name or ""
+            elif type_lower == "checkpoint" or (
+                type_lower == "model" and (not model_name or model_name == "Unknown")
+            ):
+                # Only the name and version are kept for the base model, so
+                # the LoRA-only fields are not read for these (or any other
+                # resource types such as embeddings).
+                raw_name_res = res.get("modelName")
+                raw_version_name = res.get("versionName")
+                model_name = str(raw_name_res) if raw_name_res is not None else ""
+                model_version = str(raw_version_name) if raw_version_name is not None else ""
 
         return model_name, model_version, loras
 
@@ -413,16 +536,13 @@ class CivitaiPrivateScraper:
         safe_name = self._sanitize_filename_extension(raw_name, mime_type)
 
         # Construct Image URL
-        image_url = (
-            "https://image.civitai.com/xG1nkqKTMzGDvpLrqFT7WA/"
-            f"{image_hash}/original=true/{safe_name}"
-        )
+        image_url = _ORIGINAL_MEDIA_URL(image_hash, safe_name)
 
         # Get author - try multiple fields
         author_name = (
             collection_item.get("username")
-            or collection_item.get("user", {}).get("username")
-            or collection_item.get("account", {}).get("username")
+            or (collection_item.get("user") or _EMPTY_MAPPING).get("username")
+            or (collection_item.get("account") or _EMPTY_MAPPING).get("username")
             or "Unknown"
         )
 
@@ -436,19 +556,20 @@ class CivitaiPrivateScraper:
         # Process Resources (Models/Loras)
         model_name, model_version, loras = self._process_resources(resources)
 
+        meta_get = meta.get
         return {
             "image_id": image_id,
             "image_url": image_url,
             "author": author_name,
             "tags": [],  # Will be populated by scrape() method
-            "prompt": meta.get("prompt", ""),
-            "negative_prompt": meta.get("negativePrompt", ""),
+            "prompt": meta_get("prompt", ""),
+            "negative_prompt": meta_get("negativePrompt", ""),
             "model": model_name,
             "model_version": model_version,
             "loras": loras,
-            "sampler": meta.get("sampler", ""),
-            "steps": meta.get("steps", ""),
-            "cfg_scale": meta.get("cfgScale", ""),
-            "seed": meta.get("seed", ""),
+            "sampler": meta_get("sampler", ""),
+            "steps": meta_get("steps", ""),
+            "cfg_scale": meta_get("cfgScale", ""),
+            "seed": meta_get("seed", ""),
             "raw_meta_json": meta,
         }
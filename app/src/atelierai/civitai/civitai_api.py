@@ -7,19 +7,53 @@ CivitAI API singleton for managing all CivitAI API calls.
 Refer to CIVITAI_API_REFERENCE.md for details on endpoints and usage.
 """
 
+import copy
+import logging
 import os
 import json
 import random
 import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import Future
 from datetime import timedelta
 from importlib import import_module
 from pathlib import Path
 from typing import Dict, List, Optional, Any
+from urllib.parse import quote
 
 
 from .http_client import CivitaiHttpClient, CivitaiRequestError
 
+logger = logging.getLogger(__name__)
+
+_AVAILABILITY_TTL = 3600  # seconds to reuse a check_model_availability result
+_AVAILABILITY_CACHE_MAX = 2048  # entries kept, least recently used dropped first
+
+try:
+    import orjson as _orjson  # pyright: ignore[reportMissingImports]
+except ImportError:
+    _orjson = None  # type: ignore[assignment]
+
+
+def _json_dumps_compact(value: Any) -> str:
+    """Serialize ``value`` as compact JSON, using orjson when installed."""
+    if _orjson is not None:
+        return _orjson.dumps(value).decode()
+    return json.dumps(value, separators=(",", ":"))
+
+
+def _invalid_payload_reason(payload_data: Dict) -> Optional[str]:
+    """Return why ``payload_data`` cannot match anything on CivitAI, if it can't.
+
+    CivitAI ids are positive integers, so a zero or negative ``id`` is known to
+    come back empty; callers skip the network round-trip for it.
+    """
+    value = payload_data.get("id")
+    if isinstance(value, int) and not isinstance(value, bool) and value <= 0:
+        return f"invalid id {value!r}"
+    return None
+
 
 def _get_config_value(name: str) -> Optional[str]:
     """Load a config value from either local runtime or packaged app layout."""
@@ -62,6 +96,7 @@ class CivitaiAPI:
     _TRPC_RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
     _TRPC_MAX_ATTEMPTS = 4
     _TRPC_BACKOFF_BASE_SECONDS = 0.75
+    _TRPC_429_BACKOFF_SECONDS = 30.0
 
     def __new__(cls, *args, **kwargs):
         """Singleton pattern - ensure only one instance exists."""
@@ -126,6 +161,10 @@ class CivitaiAPI:
         }
 
         self.default_meta = {"meta": {"values": {"cursor": ["undefined"]}}}
+        # Pre-serialized tRPC envelopes; only the input body varies per call.
+        meta_json = _json_dumps_compact(self.default_meta["meta"])
+        self._trpc_envelope_with_meta = '{"json":%s,"meta":' + meta_json + "}"
+        self._trpc_envelope_plain = '{"json":%s}'
 
         # Response cache (optional - can be enabled later)
         self._cache: Dict = {}
@@ -137,6 +176,13 @@ class CivitaiAPI:
         }
         self._image_uuid_index: Dict[int, str] = {}
         self._api_archive_lock = threading.Lock()
+        # Single-flight table for _make_request: (endpoint, strict, payload)
+        # -> Future of the request currently being performed for that key.
+        self._inflight_lock = threading.Lock()
+        self._inflight_requests: Dict[tuple, Future] = {}
+        # (model_id, model_version_id) -> (expires_at, availability result)
+        self._availability_lock = threading.Lock()
+        self._availability_cache: OrderedDict[tuple, tuple] = OrderedDict()
 
         self._initialized = True
 
@@ -187,7 +233,9 @@ class CivitaiAPI:
                 with open(CIVITAI_SESSION_CACHE, "r") as f:
                     token = f.read().strip()
                 if token and len(token) > 100:
-                    print(f"✅ Using cached session token from {CIVITAI_SESSION_CACHE}")
+                    logger.debug(
+                        "Using cached session token from %s", CIVITAI_SESSION_CACHE
+                    )
                     return token
             except Exception:
                 pass
@@ -262,8 +310,12 @@ class CivitaiAPI:
         sent in the json input parameters. So we should *only* send ["undefined"] when the cursor
         is first null/absent, otherwise do not send any meta data.
         """
-        input_meta = self.default_meta if input_json.get("cursor") is None else {}
-        return json.dumps({"json": input_json, **input_meta}, separators=(",", ":"))
+        envelope = (
+            self._trpc_envelope_with_meta
+            if input_json.get("cursor") is None
+            else self._trpc_envelope_plain
+        )
+        return envelope % _json_dumps_compact(input_json)
 
     def _make_raw_request(
         self,
@@ -271,13 +323,21 @@ class CivitaiAPI:
         payload_data: Dict,
         *,
         strict: bool = False,
+        trpc_input: Optional[str] = None,
     ) -> Optional[Dict]:
-        """Make a raw request to CivitAI's tRPC API."""
-        url = f"{self.base_url}/{endpoint}"
-        params = {"input": self._build_trpc_payload(payload_data)}
+        """Make a raw request to CivitAI's tRPC API.
+
+        ``trpc_input`` is an already-serialized ``input`` value; when given,
+        ``payload_data`` is not re-encoded.
+        """
+        if trpc_input is None:
+            trpc_input = self._build_trpc_payload(payload_data)
+        # The query is always the single ``input`` key, so build it here rather
+        # than having requests encode a params dict on every call.
+        url = f"{self.base_url}/{endpoint}?input={quote(trpc_input, safe='')}"
 
         try:
-            return self.http_client.request_json("GET", url, params=params)
+            return self.http_client.request_json("GET", url)
         except CivitaiRequestError as e:
             if e.status_code == 403:
                 self.http_client.activate_global_backoff(
@@ -288,7 +348,7 @@ class CivitaiAPI:
             status_text = (
                 f" (HTTP {e.status_code})" if e.status_code is not None else ""
             )
-            print(f"❌ API request error{status_text}: {e}")
+            logger.warning("API request error%s: %s", status_text, e)
             return None
 
     def _retry_delay(self, attempt: int) -> float:
@@ -335,6 +395,11 @@ class CivitaiAPI:
     ) -> Optional[Dict]:
         """Make a request to CivitAI API.
 
+        Concurrent calls with the same endpoint, payload and ``strict`` share
+        one request: the first caller performs it and the others wait for its
+        outcome (receiving their own copy of the response) instead of each
+        spending a paced dispatch on the same data.
+
         Args:
             endpoint: API endpoint (e.g., "image.get", "image.getGenerationData")
             payload_data: Data to send in request
@@ -342,11 +407,59 @@ class CivitaiAPI:
         Returns:
             Parsed JSON response, or None if request fails
         """
+        reason = _invalid_payload_reason(payload_data)
+        if reason is not None:
+            if strict:
+                raise CivitaiRequestError(f"{endpoint}: {reason}")
+            return None
+
+        # The serialized input doubles as the key and is sent as-is, so the
+        # payload is encoded once per call.
+        trpc_input = self._build_trpc_payload(payload_data)
+        key = (endpoint, strict, trpc_input)
+        future: Future
+        with self._inflight_lock:
+            existing = self._inflight_requests.get(key)
+            leader = existing is None
+            if existing is None:
+                future = self._inflight_requests[key] = Future()
+            else:
+                future = existing
+        if not leader:
+            return copy.deepcopy(future.result())
+
+        try:
+            result = self._perform_request(
+                endpoint, payload_data, strict=strict, trpc_input=trpc_input
+            )
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            # Followers copy from a private snapshot, never from the object
+            # handed to this caller, which it is free to mutate.
+            future.set_result(copy.deepcopy(result))
+            return result
+        finally:
+            with self._inflight_lock:
+                self._inflight_requests.pop(key, None)
+
+    def _perform_request(
+        self,
+        endpoint: str,
+        payload_data: Dict,
+        *,
+        strict: bool = False,
+        trpc_input: Optional[str] = None,
+    ) -> Optional[Dict]:
+        """Performs one tRPC call with payload-level retries (see _make_request)."""
         last_error: Optional[CivitaiRequestError] = None
         max_attempts = max(1, int(self._TRPC_MAX_ATTEMPTS))
 
         for attempt in range(1, max_attempts + 1):
-            data = self._make_raw_request(endpoint, payload_data, strict=strict)
+            data = self._make_raw_request(
+                endpoint, payload_data, strict=strict, trpc_input=trpc_input
+            )
             if not data:
                 return None
 
@@ -376,14 +489,17 @@ class CivitaiAPI:
                     status_code if isinstance(status_code, int) else None
                 )
                 retryable = bool(normalized_status in self._TRPC_RETRYABLE_STATUS_CODES)
-                if normalized_status == 429:
+                if normalized_status == 429 and attempt < max_attempts:
+                    # Double the shared pause on each consecutive payload 429;
+                    # the final attempt has no retry to wait for.
                     backoff_seconds = self.http_client.activate_global_backoff(
-                        30.0,
+                        self._TRPC_429_BACKOFF_SECONDS * (2 ** (attempt - 1)),
                         reason="tRPC payload 429",
                     )
                     if not strict:
-                        print(
-                            f"⏳ CivitAI payload rate limit; pausing all CivitAI requests for {backoff_seconds:.1f}s"
+                        logger.warning(
+                            "CivitAI payload rate limit; pausing all CivitAI requests for %.1fs",
+                            backoff_seconds,
                         )
                 exc = CivitaiRequestError(
                     detail,
@@ -399,8 +515,12 @@ class CivitaiAPI:
                             if exc.status_code is not None
                             else ""
                         )
-                        print(
-                            f"⚠️  API request retry {attempt}/{max_attempts - 1}{status_text}: {message}"
+                        logger.warning(
+                            "API request retry %d/%d%s: %s",
+                            attempt,
+                            max_attempts - 1,
+                            status_text,
+                            message,
                         )
                     time.sleep(self._retry_delay(attempt))
                     last_error = exc
@@ -412,7 +532,7 @@ class CivitaiAPI:
                 status_text = (
                     f" (HTTP {exc.status_code})" if exc.status_code is not None else ""
                 )
-                print(f"❌ API request error{status_text}: {exc}")
+                logger.warning("API request error%s: %s", status_text, exc)
                 # Record tombstone for terminal failures (e.g. 404 deleted resources).
                 if exc.status_code is not None:
                     self._record_to_db_cache(
@@ -496,10 +616,7 @@ class CivitaiAPI:
                 db.close()
         except Exception as exc:
             # Cache writes must never surface errors to the caller.
-            import logging as _logging
-            _logging.getLogger(__name__).debug(
-                "CivitAI DB cache write skipped: %s", exc
-            )
+            logger.debug("CivitAI DB cache write skipped: %s", exc)
 
     def _archive_root(self) -> Path:
         image_resources_path = (
@@ -576,7 +693,7 @@ class CivitaiAPI:
                     return
 
                 if endpoint == "image.getInfinite" and isinstance(response_json, dict):
-                    items = self._find_deep_image_list(response_json)
+                    items = self._find_infinite_items(response_json)
                     if not items:
                         return
                     for item in items:
@@ -757,6 +874,16 @@ class CivitaiAPI:
                 "model_status": Optional[str]  # "Published", "Deleted", etc.
             }
         """
+        cache_key = (model_id, model_version_id)
+        if model_version_id:
+            with self._availability_lock:
+                entry = self._availability_cache.get(cache_key)
+                if entry is not None:
+                    if entry[0] > time.monotonic():
+                        self._availability_cache.move_to_end(cache_key)
+                        return dict(entry[1])
+                    del self._availability_cache[cache_key]
+
         result = {
             "available": False,
             "model_id": model_id,
@@ -815,6 +942,20 @@ class CivitaiAPI:
         except Exception as e:
             result["available"] = False
             result["error"] = str(e)
+            return result
+
+        # Only a real response is cached: a None also covers timeouts, 5xx
+        # and rate limits, which must not read as "deleted" for an hour.
+        # Entries are only ever read back for a model_version_id.
+        if model_version_id and response:
+            with self._availability_lock:
+                self._availability_cache[cache_key] = (
+                    time.monotonic() + _AVAILABILITY_TTL,
+                    dict(result),
+                )
+                self._availability_cache.move_to_end(cache_key)
+                while len(self._availability_cache) > _AVAILABILITY_CACHE_MAX:
+                    self._availability_cache.popitem(last=False)
 
         return result
 
@@ -1001,17 +1142,25 @@ class CivitaiAPI:
         Returns:
             Parsed response JSON, or ``None`` on failure.
         """
-        url = f"{self.base_url}/{endpoint}"
-        params = {"input": self._build_trpc_payload(payload_data)}
+        reason = _invalid_payload_reason(payload_data)
+        if reason is not None:
+            if strict:
+                raise CivitaiRequestError(f"{endpoint}: {reason}")
+            return None
+
+        trpc_input = self._build_trpc_payload(payload_data)
+        url = f"{self.base_url}/{endpoint}?input={quote(trpc_input, safe='')}"
 
         try:
-            raw_response = self.http_client.request_json("GET", url, params=params)
+            raw_response = self.http_client.request_json("GET", url)
         except CivitaiRequestError as e:
             if e.status_code == 403:
                 self.http_client.activate_global_backoff(90.0, reason="HTTP 403 (Cloudflare)")
             if strict:
                 raise
-            print(f"❌ tRPC request error for {endpoint} (HTTP {e.status_code}): {e}")
+            logger.warning(
+                "tRPC request error for %s (HTTP %s): %s", endpoint, e.status_code, e
+            )
             return None
 
         # Check for error payload
@@ -1419,7 +1568,7 @@ class CivitaiAPI:
             if not response:
                 break
 
-            page_images = self._find_deep_image_list(response)
+            page_images = self._find_infinite_items(response)
             if page_images:
                 all_images.extend(page_images)
 
@@ -1456,7 +1605,7 @@ class CivitaiAPI:
 
         result = None
         if response:
-            result = self._find_deep_image_list(response)
+            result = self._find_infinite_items(response)
         return result if result is not None else []
 
     def fetch_collection_posts(
@@ -1541,7 +1690,7 @@ class CivitaiAPI:
                 break
 
             # Find image list in response
-            page_items = self._find_deep_image_list(response)
+            page_items = self._find_infinite_items(response)
             if not page_items:
                 break
 
@@ -1558,7 +1707,7 @@ class CivitaiAPI:
                         {"collection_item": item, "generation_data": generation_data}
                     )
                 else:
-                    print(f"⚠️  Failed to fetch data for image {img_id}")
+                    logger.warning("Failed to fetch data for image %s", img_id)
 
                 fetched += 1
 
@@ -1611,21 +1760,62 @@ class CivitaiAPI:
                 return result
         return None
 
+    def _find_infinite_items(self, obj: Any) -> Optional[List]:
+        """Return the media list of an ``*.getInfinite`` response.
+
+        Reads the known ``result.data.json.items`` location (or ``items`` on an
+        already-unwrapped payload) directly, and only falls back to the generic
+        deep search when the response has a different shape.
+        """
+        payload = obj
+        if isinstance(payload, dict) and isinstance(payload.get("result"), dict):
+            data = payload["result"].get("data")
+            if isinstance(data, dict):
+                payload = data.get("json", data)
+        if isinstance(payload, dict):
+            items = payload.get("items")
+            if isinstance(items, list) and self._is_image_list(items):
+                return items
+        return self._find_deep_image_list(obj)
+
     def _find_deep_image_list(self, obj: Dict, depth: int = 0) -> Optional[List]:
-        """Recursively finds the list of image objects in complex tRPC JSON."""
-        if depth > 10:
-            return None
+        """Finds the list of image objects in complex tRPC JSON.
+
+        Depth-first walk with an explicit stack (no recursion), visiting
+        children in the same order as before: a dict's ``items``/``pages``
+        lists first, then its remaining values. Nodes deeper than 10 levels
+        are ignored.
+        """
+        stack: List[tuple] = [(obj, depth)]
+        while stack:
+            node, node_depth = stack.pop()
+            if node_depth > 10:
+                continue
 
-        if isinstance(obj, list):
-            if self._is_image_list(obj):
-                return obj
-            return self._search_list(obj, depth)
+            if isinstance(node, list):
+                if self._is_image_list(node):
+                    return node
+                children = node
+            elif isinstance(node, dict):
+                preferred = [
+                    node[key]
+                    for key in ("items", "pages")
+                    if isinstance(node.get(key), list)
+                ]
+                children = preferred + [
+                    value
+                    for key, value in node.items()
+                    if not (key in ("items", "pages") and isinstance(value, list))
+                ]
+            else:
+                continue
 
-        if isinstance(obj, dict):
-            result = self._search_dict_keys(obj, depth)
-            if result:
-                return result
-            return self._search_dict_values(obj, depth)
+            child_depth = node_depth + 1
+            stack.extend(
+                (child, child_depth)
+                for child in reversed(children)
+                if isinstance(child, (list, dict))
+            )
 
         return None
 
@@ -24,6 +24,7 @@ from importlib import import_module
 from typing import Any, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .http_client import CivitaiRequestError
 
@@ -125,6 +126,18 @@ class CivitaiSearchClient:
         self._session_cookie = session_cookie
         self._timeout = timeout
         self._backend = backend
+        self._thread_local = threading.local()
+
+    def _get_session(self) -> requests.Session:
+        """Return this thread's keep-alive session (one per worker thread)."""
+        session = getattr(self._thread_local, "session", None)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._thread_local.session = session
+        return session
 
     # ------------------------------------------------------------------
     # Key acquisition
@@ -427,7 +440,7 @@ class CivitaiSearchClient:
         payload = {"queries": [search_query]}
 
         try:
-            resp = requests.post(
+            resp = self._get_session().post(
                 url,
                 headers=headers,
                 json=payload,
@@ -501,7 +514,9 @@ class CivitaiSearchClient:
         url = f"{_REST_API_BASE}/images"
 
         try:
-            resp = requests.get(url, params=params, timeout=self._timeout)
+            resp = self._get_session().get(
+                url, params=params, timeout=self._timeout
+            )
         except requests.RequestException as exc:
             raise CivitaiRequestError(
                 f"REST search request failed: {exc}",
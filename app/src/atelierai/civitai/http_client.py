@@ -19,6 +19,11 @@ import urllib3.util.connection as urllib3_conn
 from requests import PreparedRequest, Response
 from requests.adapters import HTTPAdapter
 
+try:
+    import orjson as _orjson  # pyright: ignore[reportMissingImports]
+except ImportError:
+    _orjson = None  # type: ignore[assignment]
+
 
 # ---------------------------------------------------------------------------
 # DNS fallback helpers
@@ -1125,6 +1130,13 @@ class CivitaiHttpClient:
             timeout=timeout,
             stream=False,
         )
+        if _orjson is not None:
+            try:
+                return _orjson.loads(response.content)
+            except _orjson.JSONDecodeError:
+                # orjson rejects NaN/Infinity and integers wider than 64 bits,
+                # which the stdlib parser accepts.
+                pass
         try:
             return response.json()
         except ValueError as exc:
@@ -0,0 +1,34 @@
+"""Shared pytest setup for the app test suite.
+
+Puts app/backend and app/src on ``sys.path`` so backend modules and the
+``atelierai`` package import without an install, and provides an in-memory
+SQLite ``db`` session fixture.
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+_APP = Path(__file__).resolve().parent.parent
+for _path in (_APP / "backend", _APP / "src"):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+import pytest  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from database import Base  # noqa: E402
+
+
+@pytest.fixture()
+def db():
+    """Provide a fresh in-memory SQLite session for each test."""
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
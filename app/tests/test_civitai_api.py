@@ -0,0 +1,216 @@
+"""Unit tests for CivitaiAPI request handling and collection paging.
+
+The network layer is replaced per test, so no CivitAI access is required.
+Run with:
+    pytest app/tests/test_civitai_api.py -v
+"""
+from __future__ import annotations
+
+import threading
+
+import pytest
+import requests
+
+from atelierai.civitai.civitai import CivitaiPrivateScraper
+from atelierai.civitai.civitai_api import CivitaiAPI
+from atelierai.civitai.http_client import CivitaiRequestError
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture()
+def api():
+    """Provide a fresh CivitaiAPI singleton with a dummy session cookie."""
+    CivitaiAPI._instance = None
+    try:
+        yield CivitaiAPI(session_cookie="x" * 120)
+    finally:
+        CivitaiAPI._instance = None
+
+
+# ---------------------------------------------------------------------------
+# CivitaiHttpClient.request_json
+# ---------------------------------------------------------------------------
+
+
+def _json_response(body: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    response.encoding = "utf-8"
+    return response
+
+
+class TestRequestJson:
+    def test_accepts_json_the_fast_parser_rejects(self, api, monkeypatch):
+        body = b'{"score": NaN, "big": 123456789012345678901234567890}'
+        monkeypatch.setattr(api.http_client, "request", lambda *args, **kwargs: _json_response(body))
+
+        data = api.http_client.request_json("GET", "https://civitai.red/api/trpc/image.get")
+
+        assert data["score"] != data["score"]  # NaN
+        assert data["big"] == 123456789012345678901234567890
+
+    def test_invalid_json_raises_request_error(self, api, monkeypatch):
+        monkeypatch.setattr(api.http_client, "request", lambda *args, **kwargs: _json_response(b"<html>"))
+
+        with pytest.raises(CivitaiRequestError, match="invalid JSON"):
+            api.http_client.request_json("GET", "https://civitai.red/api/trpc/image.get")
+
+
+# ---------------------------------------------------------------------------
+# _make_request single-flight
+# ---------------------------------------------------------------------------
+
+
+class TestMakeRequestSingleFlight:
+    def test_concurrent_identical_calls_share_one_http_request(self, api, monkeypatch):
+        follower_count = 3
+        started = threading.Event()
+        followers_joined = threading.Event()
+        joined = []
+        urls = []
+
+        class _JoinTrackingDict(dict):
+            """Signals once every follower has found the in-flight request."""
+
+            def get(self, key, default=None):
+                value = super().get(key, default)
+                if value is not None:
+                    joined.append(key)
+                    if len(joined) == follower_count:
+                        followers_joined.set()
+                return value
+
+        def fake_request_json(method, url, **kwargs):
+            urls.append(url)
+            started.set()
+            assert followers_joined.wait(5)
+            return {"result": {"data": {"json": {"id": 7, "tags": ["a"]}}}}
+
+        monkeypatch.setattr(api, "_inflight_requests", _JoinTrackingDict())
+        monkeypatch.setattr(api.http_client, "request_json", fake_request_json)
+        monkeypatch.setattr(api, "_record_to_db_cache", lambda *args, **kwargs: None)
+        monkeypatch.setattr(api, "_archive_metadata_response", lambda **kwargs: None)
+
+        results = []
+
+        def call():
+            results.append(api.fetch_basic_info(7))
+
+        leader = threading.Thread(target=call)
+        leader.start()
+        assert started.wait(5)
+        followers = [threading.Thread(target=call) for _ in range(follower_count)]
+        for thread in followers:
+            thread.start()
+        for thread in [leader, *followers]:
+            thread.join()
+
+        assert len(urls) == 1
+        assert len(results) == follower_count + 1
+        assert all(result == {"id": 7, "tags": ["a"]} for result in results)
+        results[0]["tags"].append("b")
+        assert all(result["tags"] == ["a"] for result in results[1:])
+        assert api._inflight_requests == {}
+
+
+# ---------------------------------------------------------------------------
+# Payload-level 429 backoff
+# ---------------------------------------------------------------------------
+
+
+class TestPayload429Backoff:
+    def test_backoff_doubles_per_retry_and_skips_final_attempt(self, api, monkeypatch):
+        rate_limited = {"error": {"json": {"message": "Too many", "data": {"httpStatus": 429}}}}
+        pauses = []
+
+        def fake_backoff(seconds, reason=None):
+            pauses.append(seconds)
+            return seconds
+
+        monkeypatch.setattr(api, "_make_raw_request", lambda *args, **kwargs: rate_limited)
+        monkeypatch.setattr(api.http_client, "activate_global_backoff", fake_backoff)
+        monkeypatch.setattr(api, "_record_to_db_cache", lambda *args, **kwargs: None)
+        monkeypatch.setattr("atelierai.civitai.civitai_api.time.sleep", lambda seconds: None)
+
+        assert api._make_request("image.get", {"id": 1, "authed": True}) is None
+
+        base = CivitaiAPI._TRPC_429_BACKOFF_SECONDS
+        assert pauses == [base * 2**n for n in range(CivitaiAPI._TRPC_MAX_ATTEMPTS - 1)]
+
+
+# ---------------------------------------------------------------------------
+# check_model_availability
+# ---------------------------------------------------------------------------
+
+
+class TestCheckModelAvailability:
+    def test_published_result_is_cached(self, api, monkeypatch):
+        calls = []
+
+        def fake_request(**kwargs):
+            calls.append(kwargs)
+            return {"model": {"status": "Published"}}
+
+        monkeypatch.setattr(api, "_make_request", fake_request)
+
+        first = api.check_model_availability(1, 2)
+        first["available"] = "mutated"
+        second = api.check_model_availability(1, 2)
+
+        assert len(calls) == 1
+        assert second["available"] is True
+
+    def test_failed_lookup_is_not_cached(self, api, monkeypatch):
+        """A None response (timeout, 5xx, rate limit) must not stick as 'deleted'."""
+        responses = [None, {"model": {"status": "Published"}}]
+        monkeypatch.setattr(api, "_make_request", lambda **kwargs: responses.pop(0))
+
+        first = api.check_model_availability(1, 2)
+        second = api.check_model_availability(1, 2)
+
+        assert first["available"] is False
+        assert second["available"] is True
+        assert responses == []
+
+
+# ---------------------------------------------------------------------------
+# CivitaiPrivateScraper.fetch_collection_items
+# ---------------------------------------------------------------------------
+
+
+class TestFetchCollectionItems:
+    def test_duplicate_page_stops_without_prefetching(self, api, monkeypatch):
+        """A page that trips the duplicate check must not queue another request."""
+        pages = {
+            None: ([{"id": 1, "type": "image"}, {"id": 2, "type": "image"}], "c1"),
+            "c1": ([{"id": 2, "type": "image"}, {"id": 3, "type": "image"}], "c2"),
+            "c2": ([{"id": 4, "type": "image"}], None),
+        }
+        requested = []
+
+        def fake_collection_request(collection_id, cursor, debug):
+            requested.append(cursor)
+            page_items, next_cursor = pages[cursor]
+            return {"items": page_items}, next_cursor
+
+        scraper = CivitaiPrivateScraper(session_cookie="x" * 120)
+        monkeypatch.setattr(scraper, "_make_collection_request", fake_collection_request)
+
+        items = scraper.fetch_collection_items(42)
+
+        assert [item["id"] for item in items] == [1, 2]
+        assert requested == [None, "c1"]
+
+    def test_cache_is_bounded(self, api, monkeypatch):
+        monkeypatch.setattr("atelierai.civitai.civitai_api._AVAILABILITY_CACHE_MAX", 2)
+        monkeypatch.setattr(api, "_make_request", lambda **kwargs: {"model": {"status": "Published"}})
+
+        for version_id in (1, 2, 3):
+            api.check_model_availability(10, version_id)
+
+        assert list(api._availability_cache) == [(10, 2), (10, 3)]
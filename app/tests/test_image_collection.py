@@ -0,0 +1,165 @@
+"""Unit tests for ImageCollection scan helpers.
+
+Uses the in-memory SQLite ``db`` fixture from conftest.py and a library
+directory under ``tmp_path``.
+Run with:
+    pytest app/tests/test_image_collection.py -v
+"""
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+import image_collection
+import image_processor
+from image_collection import ImageCollection
+from image_processor import ImageProcessor
+from models import ImageModel
+
+
+# ---------------------------------------------------------------------------
+# Fixtures / helpers
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture()
+def collection(db, tmp_path):
+    """ImageCollection rooted at an empty library directory."""
+    library = ImageCollection(db)
+    library.library_path = tmp_path
+    return library
+
+
+def _add_image(db, file_path: str, file_hash: str) -> ImageModel:
+    image = ImageModel(file_path=file_path, file_name=file_path, file_hash=file_hash)
+    db.add(image)
+    db.flush()
+    return image
+
+
+# ---------------------------------------------------------------------------
+# _cleanup_orphaned_records
+# ---------------------------------------------------------------------------
+
+
+class TestCleanupOrphanedRecords:
+    def test_removes_only_rows_without_a_file(self, db, collection, tmp_path):
+        (tmp_path / "kept.png").write_bytes(b"x")
+        (tmp_path / "gone.json").write_text("{}")
+        kept = _add_image(db, "kept.png", "h1")
+        _add_image(db, "gone.png", "h2")
+        db.commit()
+
+        collection._cleanup_orphaned_records()
+
+        assert [image.id for image in db.query(ImageModel)] == [kept.id]
+        assert collection.results["records_removed"] == 1
+        assert not (tmp_path / "gone.json").exists()
+
+
+# ---------------------------------------------------------------------------
+# find_existing_by_hash
+# ---------------------------------------------------------------------------
+
+
+class TestFindExistingByHash:
+    def test_matches_per_hash_lookup_across_chunks(self, db, collection, monkeypatch):
+        """Chunked IN lookups pick the same row as find_in_database would."""
+        monkeypatch.setattr(collection, "HASH_LOOKUP_CHUNK", 2)
+        first_h3 = _add_image(db, "a.png", "h3")
+        for index in range(5):
+            _add_image(db, f"img{index}.png", f"h{index}")
+        _add_image(db, "b.png", "h1")
+        db.commit()
+
+        hashes = ["h0", "h1", "h2", "h3", "h4", "h1", "", "missing"]
+        existing = collection.find_existing_by_hash(hashes)
+
+        assert list(existing) == ["h0", "h1", "h2", "h3", "h4", "missing"]
+        assert existing["missing"] is None
+        assert existing["h3"].id == first_h3.id
+        for file_hash in ["h0", "h1", "h2", "h3", "h4"]:
+            expected = (
+                db.query(ImageModel)
+                .filter(ImageModel.file_hash == file_hash)
+                .order_by(ImageModel.id)
+                .first()
+            )
+            assert existing[file_hash].id == expected.id
+
+    def test_no_hashes_issues_no_query(self, collection):
+        assert collection.find_existing_by_hash([None, ""]) == {}
+
+
+# ---------------------------------------------------------------------------
+# scan() batches
+# ---------------------------------------------------------------------------
+
+
+class _BrokenFileProcessor(ImageProcessor):
+    """ImageProcessor that fails for one specific file name."""
+
+    def __init__(self, file_path, *args, **kwargs):
+        if Path(file_path).name == "broken.png":
+            raise OSError("simulated read failure")
+        super().__init__(file_path, *args, **kwargs)
+
+
+class TestScanBatches:
+    def test_failing_file_does_not_abort_its_batch(self, db, collection, tmp_path, monkeypatch):
+        monkeypatch.setattr(image_collection, "ImageProcessor", _BrokenFileProcessor)
+        monkeypatch.setattr(collection, "SCAN_BATCH_SIZE", 2)
+        colors = ["red", "green", "blue", "white"]
+        for index, color in enumerate(colors):
+            Image.new("RGB", (8 + index, 8), color).save(tmp_path / f"img{index}.png")
+        Image.new("RGB", (8, 8), "black").save(tmp_path / "broken.png")
+
+        result = collection.scan()
+
+        assert result["images_scanned"] == len(colors)
+        assert result["images_added"] == len(colors)
+        assert db.query(ImageModel).count() == len(colors)
+        assert len(result["errors"]) == 1
+        assert "broken.png" in result["errors"][0]
+        assert (tmp_path / "broken.png").exists()
+
+    def test_duplicate_files_in_one_batch_share_a_record(self, db, collection, tmp_path, monkeypatch):
+        monkeypatch.setattr(collection, "SCAN_BATCH_SIZE", 4)
+        image = Image.new("RGB", (8, 8), "red")
+        image.save(tmp_path / "copy_a.png")
+        image.save(tmp_path / "copy_b.png")
+
+        result = collection.scan()
+
+        assert result["images_scanned"] == 2
+        assert result["images_added"] == 1
+        assert db.query(ImageModel).count() == 1
+
+    def test_new_files_get_blurhash_on_worker_threads(self, db, collection, tmp_path, monkeypatch):
+        encode_threads = []
+
+        class _FakeBlurhash:
+            @staticmethod
+            def encode(pixel_rows, components_x, components_y):
+                encode_threads.append(threading.current_thread())
+                return "fakehash"
+
+        monkeypatch.setattr(image_processor, "_blurhash_mod", _FakeBlurhash)
+        monkeypatch.setattr(collection, "SCAN_BATCH_SIZE", 2)
+        for index, color in enumerate(["red", "green", "blue"]):
+            Image.new("RGB", (8 + index, 8), color).save(tmp_path / f"img{index}.png")
+
+        collection.scan()
+
+        assert [image.blurhash for image in db.query(ImageModel)] == ["fakehash"] * 3
+        assert len(encode_threads) == 3
+        assert threading.main_thread() not in encode_threads
+
+        encode_threads.clear()
+        rescan = ImageCollection(db)
+        rescan.library_path = tmp_path
+        rescan.scan()
+        assert encode_threads == []
@@ -0,0 +1,77 @@
+"""Regression tests for ImageProcessor metadata extraction.
+
+Uses the in-memory SQLite ``db`` fixture from conftest.py and PNGs written
+to ``tmp_path``.
+Run with:
+    pytest app/tests/test_image_processor_metadata.py -v
+"""
+from __future__ import annotations
+
+import struct
+import zlib
+from pathlib import Path
+
+from PIL import Image
+
+from image_processor import ImageProcessor
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _png_chunk(kind: bytes, data: bytes) -> bytes:
+    return (
+        struct.pack(">I", len(data))
+        + kind
+        + data
+        + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF)
+    )
+
+
+def _write_png_with_trailing_text(path: Path, keyword: str, text: str) -> None:
+    """Write a PNG whose tEXt chunk sits after IDAT, just before IEND."""
+    Image.new("RGB", (16, 16), (200, 40, 40)).save(path)
+    raw = path.read_bytes()
+    iend = raw.rindex(b"IEND") - 4
+    chunk = _png_chunk(b"tEXt", keyword.encode("latin-1") + b"\0" + text.encode("latin-1"))
+    path.write_bytes(raw[:iend] + chunk + raw[iend:])
+
+
+# ---------------------------------------------------------------------------
+# PNG text chunks
+# ---------------------------------------------------------------------------
+
+
+class TestPngTextAfterIdat:
+    def test_generation_parameters_after_idat_are_extracted(self, db, tmp_path):
+        """A1111 parameters stored after IDAT must still be parsed."""
+        image_path = tmp_path / "trailing.png"
+        _write_png_with_trailing_text(
+            image_path,
+            "parameters",
+            "a red square\nSteps: 20, Sampler: Euler, CFG scale: 7",
+        )
+
+        processor = ImageProcessor(str(image_path), db, str(tmp_path))
+
+        assert processor.exif_data.get("parameters", "").startswith("a red square")
+        assert str(processor.exif_data.get("Steps")) == "20"
+        assert processor.exif_data.get("Sampler") == "Euler"
+
+    def test_raw_profile_exif_after_idat_is_extracted(self, db, tmp_path):
+        """ImageMagick-style "Raw profile type exif" chunks yield EXIF tags."""
+        exif = Image.Exif()
+        exif[0x010F] = "TestMake"  # Make
+        exif[0x0131] = "TestSoftware"  # Software
+        payload = b"Exif\x00\x00" + exif.tobytes()
+        hex_payload = payload.hex()
+        profile = f"\nexif\n{len(payload):8d}\n{hex_payload}\n"
+        image_path = tmp_path / "raw_profile.png"
+        _write_png_with_trailing_text(image_path, "Raw profile type exif", profile)
+
+        processor = ImageProcessor(str(image_path), db, str(tmp_path))
+
+        assert processor.exif_data.get("Make") == "TestMake"
+        assert processor.exif_data.get("Software") == "TestSoftware"